@@ -69,16 +69,20 @@ from fastmcp_extensions.server_config import (
     get_mcp_config,
 )
 from fastmcp_extensions.tool_filters import (
+    ALWAYS_TRUE,
+    BoundToolFilter,
     ToolFilterFn,
     assert_http_trusted_execution_disabled,
     is_trusted_execution_enabled,
 )
 
 __all__ = [
+    "ALWAYS_TRUE",
     "DEFAULT_HASH_ALGORITHM",
     "DEFAULT_KEY_PREFIX",
     "REDACTION_PLACEHOLDER",
     "AuthorizationRedactionFilter",
+    "BoundToolFilter",
     "ClientCredentials",
     "ClientCredentialsExchangeMiddleware",
     "HashKeyNormalizer",
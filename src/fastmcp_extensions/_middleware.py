@@ -13,15 +13,111 @@ See Also:
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import FastMCP
-from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 from fastmcp.tools.tool import ToolResult
 from mcp import types as mt
 from mcp.types import Tool
 
-from fastmcp_extensions.tool_filters import ToolFilterFn
+from fastmcp_extensions.server_config import MCPServerConfig
+from fastmcp_extensions.tool_filters import (
+    ALWAYS_TRUE,
+    BoundToolFilter,
+    ToolFilterFn,
+    _allow_all_tools,
+    _bind_request,
+    _is_http_transport_request,
+)
+
+if TYPE_CHECKING:
+    from fastmcp.tools import Tool as FastTool
+
+
+@lru_cache(maxsize=256)
+def _denied_message(tool_name: str) -> str:
+    """Return the error message for a call to a filtered-out tool."""
+    return (
+        f"Tool '{tool_name}' is not available. "
+        "It may be restricted based on your current session configuration."
+    )
+
+
+def _bind_tool_filter(
+    tool_filter: ToolFilterFn,
+    binder: BoundToolFilter | None,
+    app: FastMCP,
+) -> Callable[[Tool], bool]:
+    """Bind a tool filter to the current request, using its binder when present.
+
+    Binders read (and validate) config up front. If that raises `ValueError`, the
+    filter is called per tool instead, so invalid config only fails once a tool
+    is actually evaluated, the same as calling the filter directly.
+    """
+    if binder is not None:
+        try:
+            return binder(app)
+        except ValueError:
+            pass
+    return lambda tool: tool_filter(tool, app)
+
+
+def _compose_filters(filters: Sequence[ToolFilterFn]) -> ToolFilterFn:
+    """Combine tool filters into a single filter that shows a tool only if all do.
+
+    Filters are evaluated in order and evaluation stops at the first one that
+    hides the tool. The composed binder drops filters whose bound predicate shows
+    every tool (typically because their config is unset).
+
+    Args:
+        filters: The tool filters to combine.
+
+    Returns:
+        A single tool filter, or `ALWAYS_TRUE` if no filters remain.
+    """
+    active_filters = tuple(f for f in filters if f is not ALWAYS_TRUE)
+    if not active_filters:
+        return ALWAYS_TRUE
+    if len(active_filters) == 1:
+        return active_filters[0]
+
+    binders: tuple[BoundToolFilter | None, ...] = tuple(
+        getattr(f, "__bind_request__", None) for f in active_filters
+    )
+
+    def _bind_composed(app: FastMCP) -> Callable[[Tool], bool]:
+        predicates = tuple(
+            predicate
+            for predicate in (
+                _bind_tool_filter(f, binder, app)
+                for f, binder in zip(active_filters, binders, strict=True)
+            )
+            if predicate is not _allow_all_tools
+        )
+        if not predicates:
+            return _allow_all_tools
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def _all_predicates(tool: Tool) -> bool:
+            return all(predicate(tool) for predicate in predicates)
+
+        return _all_predicates
+
+    @_bind_request(_bind_composed)
+    def _composed_filter(tool: Tool, app: FastMCP) -> bool:
+        return all(filter_fn(tool, app) for filter_fn in active_filters)
+
+    return _composed_filter
 
 
 class ToolFilterMiddleware(Middleware):
@@ -37,6 +133,15 @@ class ToolFilterMiddleware(Middleware):
         app: The FastMCP application instance.
         tool_filter: A callable that takes (Tool, FastMCP) and returns
             True if the tool should be visible, False to hide it.
+        list_tools_cache_ttl: Seconds to reuse per-tool filter decisions for a
+            given set of config values. Defaults to 0, which disables caching.
+            The upstream tool list is always fetched from the next handler, so
+            session and auth visibility are never shared. When enabled, the
+            filter must depend only on the tool name, the header and env var
+            values behind the app's config args, and the transport. Callable
+            defaults are assumed to be stable for the life of the cache entry.
+        filter_cache_size: Maximum number of config fingerprints whose filter
+            decisions are kept when caching is enabled.
 
     Example:
         ```python
@@ -59,20 +164,57 @@ class ToolFilterMiddleware(Middleware):
         app: FastMCP,
         *,
         tool_filter: ToolFilterFn,
+        list_tools_cache_ttl: float = 0,
+        filter_cache_size: int = 128,
     ) -> None:
         """Initialize the middleware.
 
         Args:
             app: The FastMCP application instance.
             tool_filter: A callable that determines tool visibility.
+            list_tools_cache_ttl: Seconds to cache filter decisions (0 disables).
+            filter_cache_size: Maximum number of cached config fingerprints.
         """
         self._app = app
         self._tool_filter = tool_filter
+        self._passthrough = tool_filter is ALWAYS_TRUE
+        self._filter_binder: BoundToolFilter | None = getattr(
+            tool_filter, "__bind_request__", None
+        )
+        self._list_tools_cache_ttl = list_tools_cache_ttl
+        self._filter_cache_size = filter_cache_size
+        self._filter_cache: OrderedDict[
+            tuple[bool, bytes], tuple[float, dict[str, bool]]
+        ] = OrderedDict()
+        self._mcp_tool_cache: dict[int, tuple[weakref.ref[FastTool], Tool]] = {}
+
+    @classmethod
+    def from_filters(
+        cls,
+        app: FastMCP,
+        tool_filters: Sequence[ToolFilterFn],
+        **kwargs: Any,
+    ) -> ToolFilterMiddleware:
+        """Create one middleware that serves several tool filters.
+
+        A tool is visible only if every filter shows it. One middleware makes one
+        pass over the tool list per `list_tools` request and one tool lookup per
+        call, regardless of how many filters are configured.
+
+        Args:
+            app: The FastMCP application instance.
+            tool_filters: The tool filters to combine, evaluated in order.
+            **kwargs: Passed through to the constructor.
+
+        Returns:
+            A middleware serving the combined filter.
+        """
+        return cls(app, tool_filter=_compose_filters(tool_filters), **kwargs)
 
     async def on_list_tools(
         self,
         context: MiddlewareContext[mt.ListToolsRequest],
-        call_next: Callable[[MiddlewareContext[mt.ListToolsRequest]], Sequence[Tool]],
+        call_next: CallNext[mt.ListToolsRequest, Sequence[Tool]],
     ) -> Sequence[Tool]:
         """Filter the tool list based on the filter function.
 
@@ -81,15 +223,95 @@ class ToolFilterMiddleware(Middleware):
             call_next: The next handler in the chain.
 
         Returns:
-            Filtered sequence of tools.
+            Filtered sequence of tools. The upstream sequence itself is returned
+            when no tool was filtered out.
         """
+        if self._passthrough:
+            return await call_next(context)
+
         tools = await call_next(context)
-        return [tool for tool in tools if self._tool_filter(tool, self._app)]
+        if self._list_tools_cache_ttl <= 0:
+            predicate = self._bind_filter()
+            if predicate is _allow_all_tools:
+                return tools
+            visible = [tool for tool in tools if predicate(tool)]
+        else:
+            decisions = self._get_filter_decisions()
+            bound: Callable[[Tool], bool] | None = None
+            visible = []
+            for tool in tools:
+                allowed = decisions.get(tool.name)
+                if allowed is None:
+                    if bound is None:
+                        bound = self._bind_filter()
+                    allowed = decisions[tool.name] = bound(tool)
+                if allowed:
+                    visible.append(tool)
+        # Hand back the upstream sequence untouched when nothing was hidden.
+        return tools if len(visible) == len(tools) else visible
+
+    def _bind_filter(self) -> Callable[[Tool], bool]:
+        """Return a per-tool predicate for the current request.
+
+        Filters exposing a `__bind_request__` binder (see `BoundToolFilter`) read
+        their config once here; other filters are called per tool as usual. The
+        binder is looked up once at construction.
+        """
+        return _bind_tool_filter(self._tool_filter, self._filter_binder, self._app)
+
+    def _get_filter_decisions(self) -> dict[str, bool]:
+        """Return the cached tool-name decisions for the current config values.
+
+        Entries expire after the TTL and the least recently used fingerprint is
+        evicted once `filter_cache_size` is exceeded.
+        """
+        now = time.monotonic()
+        key = self._config_fingerprint()
+        cached = self._filter_cache.get(key)
+        if cached is not None and now - cached[0] < self._list_tools_cache_ttl:
+            self._filter_cache.move_to_end(key)
+            return cached[1]
+
+        decisions: dict[str, bool] = {}
+        self._filter_cache[key] = (now, decisions)
+        self._filter_cache.move_to_end(key)
+        if len(self._filter_cache) > self._filter_cache_size:
+            self._filter_cache.popitem(last=False)
+        return decisions
+
+    def _config_fingerprint(self) -> tuple[bool, bytes]:
+        """Fingerprint the request-scoped inputs a filter may depend on.
+
+        Returns the current transport plus a SHA-256 digest of the raw header and
+        env var values each registered config arg reads, so secrets such as API
+        keys are never held in cache keys. The values are not resolved: defaults
+        and `normalize_fn` are not run, which keeps a cache hit cheap and avoids
+        side effects from callable defaults on every list call.
+        """
+        config: MCPServerConfig | None = getattr(self._app, "x_mcp_server_config", None)
+        digest = hashlib.sha256()
+        if config is not None:
+            headers: dict[str, str] = {}
+            if any(arg.http_header_key for arg in config.config_args):
+                headers = {
+                    key.lower(): value
+                    for key, value in (get_http_headers() or {}).items()
+                }
+            for arg in config.config_args:
+                header_value = (
+                    headers.get(arg.http_header_key.lower())
+                    if arg.http_header_key
+                    else None
+                )
+                env_value = os.environ.get(arg.env_var) if arg.env_var else None
+                digest.update(repr((header_value, env_value)).encode())
+                digest.update(b"\0")
+        return (_is_http_transport_request(), digest.digest())
 
     async def on_call_tool(
         self,
         context: MiddlewareContext[mt.CallToolRequestParams],
-        call_next: Callable[[MiddlewareContext[mt.CallToolRequestParams]], ToolResult],
+        call_next: CallNext[mt.CallToolRequestParams, ToolResult],
     ) -> ToolResult:
         """Deny calls to filtered tools.
 
@@ -103,21 +325,24 @@ class ToolFilterMiddleware(Middleware):
         Raises:
             ValueError: If the tool is filtered out.
         """
+        if self._passthrough:
+            return await call_next(context)
+
         tool_name = context.message.name
 
         # Look up the tool to check if it should be filtered
         tool = await self._get_tool_by_name(tool_name)
         if tool is not None and not self._tool_filter(tool, self._app):
-            raise ValueError(
-                f"Tool '{tool_name}' is not available. "
-                "It may be restricted based on your current session configuration."
-            )
+            raise ValueError(_denied_message(tool_name))
 
         return await call_next(context)
 
     async def _get_tool_by_name(self, name: str) -> Tool | None:
         """Look up a tool by name from the app.
 
+        The MCP conversion of each FastMCP tool is cached for as long as that tool
+        object is alive, so repeated calls to the same tool skip `to_mcp_tool()`.
+
         Args:
             name: The tool name to look up.
 
@@ -128,4 +353,13 @@ class ToolFilterMiddleware(Middleware):
         if fast_tool is None:
             return None
 
-        return fast_tool.to_mcp_tool()
+        key = id(fast_tool)
+        cached = self._mcp_tool_cache.get(key)
+        if cached is not None and cached[0]() is fast_tool:
+            return cached[1]
+
+        mcp_tool = fast_tool.to_mcp_tool()
+        cache = self._mcp_tool_cache
+        tool_ref = weakref.ref(fast_tool, lambda _ref: cache.pop(key, None))
+        cache[key] = (tool_ref, mcp_tool)
+        return mcp_tool
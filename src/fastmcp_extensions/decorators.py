@@ -8,10 +8,11 @@ on the functions for later use during registration with a FastMCP app.
 
 from __future__ import annotations
 
-import inspect
+import sys
 from collections.abc import Callable, Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from fastmcp.server.providers import Provider
 
@@ -23,6 +24,9 @@ from fastmcp_extensions.annotations import (
     REQUIRES_CLIENT_FILESYSTEM,
 )
 
+if TYPE_CHECKING:
+    from types import FrameType
+
 F = TypeVar("F", bound=Callable[..., Any])
 P = TypeVar("P", bound=Callable[[], Provider])
 
@@ -31,19 +35,56 @@ _REGISTERED_PROVIDERS: list[tuple[Callable[[], Provider], dict[str, Any]]] = []
 _REGISTERED_RESOURCES: list[tuple[Callable[..., Any], dict[str, Any]]] = []
 _REGISTERED_PROMPTS: list[tuple[Callable[..., Any], dict[str, Any]]] = []
 
+# Per-mcp_module indexes of the registries above, so registration for one module
+# does not have to scan every registered callable.
+_REGISTERED_TOOLS_BY_MODULE: dict[
+    str, list[tuple[Callable[..., Any], dict[str, Any]]]
+] = {}
+_REGISTERED_PROVIDERS_BY_MODULE: dict[
+    str, list[tuple[Callable[[], Provider], dict[str, Any]]]
+] = {}
+_REGISTERED_RESOURCES_BY_MODULE: dict[
+    str, list[tuple[Callable[..., Any], dict[str, Any]]]
+] = {}
+_REGISTERED_PROMPTS_BY_MODULE: dict[
+    str, list[tuple[Callable[..., Any], dict[str, Any]]]
+] = {}
+
+
+def _add_registration(
+    registry: list[tuple[Any, dict[str, Any]]],
+    registry_by_module: dict[str, list[tuple[Any, dict[str, Any]]]],
+    func: Any,
+    annotations: dict[str, Any],
+) -> None:
+    """Record a registration in both the flat registry and its per-module index."""
+    entry = (func, annotations)
+    registry.append(entry)
+    registry_by_module.setdefault(annotations["mcp_module"], []).append(entry)
+
+
+@lru_cache(maxsize=None)
+def _file_stem(filename: str) -> str:
+    """Return the stem of a source file path (e.g., "github" for "github.py")."""
+    return Path(filename).stem
+
 
 def _get_caller_file_stem() -> str:
     """Get the file stem of the caller's module.
 
     Walks up the call stack to find the first frame outside this module,
     then returns the stem of that file (e.g., "github" for "github.py").
+    Only each frame's code filename is read, so no source context is loaded.
 
     Returns:
         The file stem of the calling module.
     """
-    for frame_info in inspect.stack():
-        if frame_info.filename != __file__:
-            return Path(frame_info.filename).stem
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename != __file__:
+            return _file_stem(filename)
+        frame = frame.f_back
     return "unknown"
 
 
@@ -58,8 +99,9 @@ def _normalize_mcp_module(mcp_module: str) -> str:
 
     Returns:
         The normalized mcp_module (last segment of a dotted path, or the input if no dots).
+        The result is interned, so decorator and registration lookups compare by identity.
     """
-    return mcp_module.rsplit(".", 1)[-1]
+    return sys.intern(mcp_module.rsplit(".", 1)[-1])
 
 
 def mcp_tool(
@@ -97,7 +139,7 @@ def mcp_tool(
         def list_connectors_in_repo():
             ...
     """
-    mcp_module_str = _get_caller_file_stem()
+    mcp_module_str = _normalize_mcp_module(_get_caller_file_stem())
 
     annotations: dict[str, Any] = {
         "mcp_module": mcp_module_str,
@@ -113,7 +155,9 @@ def mcp_tool(
         if extra_help_text:
             func.__doc__ = ((func.__doc__ or "") + "\n\n" + extra_help_text).rstrip()
 
-        _REGISTERED_TOOLS.append((func, annotations))
+        _add_registration(
+            _REGISTERED_TOOLS, _REGISTERED_TOOLS_BY_MODULE, func, annotations
+        )
         return func
 
     return decorator
@@ -131,7 +175,7 @@ def mcp_provider(
     Returns:
         Decorator function that tags the provider factory for registration
     """
-    mcp_module_str = _get_caller_file_stem()
+    mcp_module_str = _normalize_mcp_module(_get_caller_file_stem())
 
     provider_annotations: dict[str, Any] = {
         "mcp_module": mcp_module_str,
@@ -139,7 +183,12 @@ def mcp_provider(
     provider_annotations.update(annotations or {})
 
     def decorator(func: P) -> P:
-        _REGISTERED_PROVIDERS.append((func, provider_annotations))
+        _add_registration(
+            _REGISTERED_PROVIDERS,
+            _REGISTERED_PROVIDERS_BY_MODULE,
+            func,
+            provider_annotations,
+        )
         return func
 
     return decorator
@@ -168,7 +217,7 @@ def mcp_prompt(
         def my_prompt_func() -> list[dict[str, str]]:
             return [{"role": "user", "content": "Hello"}]
     """
-    mcp_module_str = _get_caller_file_stem()
+    mcp_module_str = _normalize_mcp_module(_get_caller_file_stem())
 
     def decorator(
         func: Callable[..., list[dict[str, str]]],
@@ -178,7 +227,9 @@ def mcp_prompt(
             "description": description,
             "mcp_module": mcp_module_str,
         }
-        _REGISTERED_PROMPTS.append((func, annotations))
+        _add_registration(
+            _REGISTERED_PROMPTS, _REGISTERED_PROMPTS_BY_MODULE, func, annotations
+        )
         return func
 
     return decorator
@@ -207,7 +258,7 @@ def mcp_resource(
         def get_version() -> dict:
             return {"version": "1.0.0"}
     """
-    mcp_module_str = _get_caller_file_stem()
+    mcp_module_str = _normalize_mcp_module(_get_caller_file_stem())
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         annotations = {
@@ -216,7 +267,9 @@ def mcp_resource(
             "mime_type": mime_type,
             "mcp_module": mcp_module_str,
         }
-        _REGISTERED_RESOURCES.append((func, annotations))
+        _add_registration(
+            _REGISTERED_RESOURCES, _REGISTERED_RESOURCES_BY_MODULE, func, annotations
+        )
         return func
 
     return decorator
@@ -231,3 +284,7 @@ def _clear_registrations() -> None:
     _REGISTERED_PROVIDERS.clear()
     _REGISTERED_PROMPTS.clear()
     _REGISTERED_RESOURCES.clear()
+    _REGISTERED_TOOLS_BY_MODULE.clear()
+    _REGISTERED_PROVIDERS_BY_MODULE.clear()
+    _REGISTERED_PROMPTS_BY_MODULE.clear()
+    _REGISTERED_RESOURCES_BY_MODULE.clear()
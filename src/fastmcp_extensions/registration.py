@@ -8,10 +8,11 @@ with a FastMCP app, filtered by mcp_module.
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Sequence
+import sys
+import weakref
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any, get_args
+from typing import TYPE_CHECKING, Any, get_args
 
 from fastmcp import FastMCP
 from fastmcp.server.transforms import GetToolNext, Transform
@@ -19,13 +20,21 @@ from fastmcp.tools import Tool
 from fastmcp.utilities.versions import VersionSpec
 
 from fastmcp_extensions.decorators import (
-    _REGISTERED_PROMPTS,
-    _REGISTERED_PROVIDERS,
-    _REGISTERED_RESOURCES,
-    _REGISTERED_TOOLS,
+    _REGISTERED_PROMPTS_BY_MODULE,
+    _REGISTERED_PROVIDERS_BY_MODULE,
+    _REGISTERED_RESOURCES_BY_MODULE,
+    _REGISTERED_TOOLS_BY_MODULE,
+    _file_stem,
     _normalize_mcp_module,
 )
 
+if TYPE_CHECKING:
+    from types import FrameType
+
+_PARAM_NAMES_CACHE: weakref.WeakKeyDictionary[Callable[..., Any], frozenset[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 @dataclass
 class PromptDef:
@@ -92,21 +101,50 @@ def _get_caller_file_stem() -> str:
 
     Walks up the call stack to find the first frame outside this module,
     then returns the stem of that file (e.g., "github" for "github.py").
+    Only each frame's code filename is read, so no source context is loaded.
 
     Returns:
         The file stem of the calling module.
     """
-    for frame_info in inspect.stack():
-        if frame_info.filename != __file__:
-            return Path(frame_info.filename).stem
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename != __file__:
+            return _file_stem(filename)
+        frame = frame.f_back
     return "unknown"
 
 
+def _get_param_names(fn: Callable[..., Any]) -> frozenset[str]:
+    """Get the parameter names of a callable, cached per callable.
+
+    Keyed weakly on the callable itself, so entries disappear with the callable and
+    cannot be confused with a later object that reuses its `id()`.
+
+    Args:
+        fn: The callable to inspect.
+
+    Returns:
+        The names of the callable's parameters.
+    """
+    try:
+        cached = _PARAM_NAMES_CACHE.get(fn)
+    except TypeError:
+        # Not weak-referenceable (or unhashable): fall back to an uncached lookup.
+        return frozenset(inspect.signature(fn).parameters)
+
+    if cached is None:
+        cached = frozenset(inspect.signature(fn).parameters)
+        _PARAM_NAMES_CACHE[fn] = cached
+    return cached
+
+
 def _register_mcp_callables(
     *,
     app: FastMCP,
     mcp_module: str,
-    resource_list: list[tuple[Callable[..., Any], dict[str, Any]]],
+    resource_list: Mapping[str, Sequence[tuple[Callable[..., Any], dict[str, Any]]]]
+    | Sequence[tuple[Callable[..., Any], dict[str, Any]]],
     register_fn: Callable[[FastMCP, Callable[..., Any], dict[str, Any]], None],
 ) -> None:
     """Register resources and tools with the FastMCP app, filtered by mcp_module.
@@ -115,16 +153,21 @@ def _register_mcp_callables(
         app: The FastMCP app instance
         mcp_module: The mcp_module to register tools for. Can be a simple name (e.g., "github")
             or a full module path (e.g., "my_package.mcp.github" from __name__).
-        resource_list: List of (callable, annotations) tuples to register
+        resource_list: Either a mapping of mcp_module to (callable, annotations) tuples,
+            or a flat list of (callable, annotations) tuples to filter by mcp_module
         register_fn: Function to call for each registration
     """
     mcp_module_str = _normalize_mcp_module(mcp_module)
 
-    filtered_callables = [
-        (func, ann)
-        for func, ann in resource_list
-        if ann.get("mcp_module") == mcp_module_str
-    ]
+    filtered_callables: Sequence[tuple[Callable[..., Any], dict[str, Any]]]
+    if isinstance(resource_list, Mapping):
+        filtered_callables = resource_list.get(mcp_module_str, ())
+    else:
+        filtered_callables = [
+            (func, ann)
+            for func, ann in resource_list
+            if ann.get("mcp_module") == mcp_module_str
+        ]
 
     for callable_fn, callable_annotations in filtered_callables:
         register_fn(app, callable_fn, callable_annotations)
@@ -147,6 +190,9 @@ def register_mcp_tools(
     """
     if mcp_module is None:
         mcp_module = _get_caller_file_stem()
+    mcp_module_str = _normalize_mcp_module(mcp_module)
+    # Deduplicated once, keeping the caller's order so schemas are stable
+    static_exclude = tuple(dict.fromkeys(exclude_args)) if exclude_args else ()
 
     def _register_fn(
         app: FastMCP,
@@ -154,9 +200,9 @@ def register_mcp_tools(
         annotations: dict[str, Any],
     ) -> None:
         tool_exclude_args: list[str] | None = None
-        if exclude_args:
-            params = set(inspect.signature(callable_fn).parameters.keys())
-            excluded = [name for name in exclude_args if name in params]
+        if static_exclude:
+            params = _get_param_names(callable_fn)
+            excluded = [name for name in static_exclude if name in params]
             tool_exclude_args = excluded if excluded else None
 
         app.tool(
@@ -167,16 +213,12 @@ def register_mcp_tools(
 
     _register_mcp_callables(
         app=app,
-        mcp_module=mcp_module,
-        resource_list=_REGISTERED_TOOLS,
+        mcp_module=mcp_module_str,
+        resource_list=_REGISTERED_TOOLS_BY_MODULE,
         register_fn=_register_fn,
     )
 
-    matching_providers = [
-        (provider_factory, provider_annotations)
-        for provider_factory, provider_annotations in _REGISTERED_PROVIDERS
-        if provider_annotations.get("mcp_module") == _normalize_mcp_module(mcp_module)
-    ]
+    matching_providers = _REGISTERED_PROVIDERS_BY_MODULE.get(mcp_module_str, ())
 
     for provider_factory, provider_annotations in matching_providers:
         provider = provider_factory()
@@ -211,7 +253,7 @@ def register_mcp_prompts(
     _register_mcp_callables(
         app=app,
         mcp_module=mcp_module,
-        resource_list=_REGISTERED_PROMPTS,
+        resource_list=_REGISTERED_PROMPTS_BY_MODULE,
         register_fn=_register_fn,
     )
 
@@ -244,6 +286,6 @@ def register_mcp_resources(
     _register_mcp_callables(
         app=app,
         mcp_module=mcp_module,
-        resource_list=_REGISTERED_RESOURCES,
+        resource_list=_REGISTERED_RESOURCES_BY_MODULE,
         register_fn=_register_fn,
     )
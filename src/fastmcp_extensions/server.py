@@ -63,12 +63,11 @@ app = mcp_server(
 from __future__ import annotations
 
 import importlib.metadata as md
-import inspect
-import pkgutil
-import subprocess
+import os
+import sys
 from collections.abc import Callable
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import FastMCP
 
@@ -76,17 +75,31 @@ from fastmcp_extensions._middleware import ToolFilterMiddleware
 from fastmcp_extensions.server_config import (
     MCPServerConfig,
     MCPServerConfigArg,
+    _RequestConfigCacheMiddleware,
 )
 from fastmcp_extensions.tool_filters import ToolFilterFn
 
+if TYPE_CHECKING:
+    from types import FrameType
+
 
 @lru_cache(maxsize=1)
 def _get_git_sha() -> str | None:
     """Get the current git SHA (short form).
 
+    A SHA baked into the deployment via the `GIT_SHA` environment variable takes
+    precedence, so packaged servers never have to shell out to git. Otherwise the
+    SHA is read from the working tree, which only succeeds in a source checkout.
+
     Returns:
         The short git SHA, or None if not in a git repository.
     """
+    env_sha = os.environ.get("GIT_SHA", "").strip()
+    if env_sha:
+        return env_sha
+
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -100,6 +113,7 @@ def _get_git_sha() -> str | None:
         return None
 
 
+@lru_cache(maxsize=1)
 def _get_fastmcp_version() -> str | None:
     """Get the installed FastMCP version.
 
@@ -112,6 +126,7 @@ def _get_fastmcp_version() -> str | None:
         return None
 
 
+@lru_cache(maxsize=None)
 def _get_package_version(package_name: str) -> str:
     """Get the version of a package.
 
@@ -133,19 +148,18 @@ def _create_server_info_resource(
 ) -> None:
     """Register the server info resource with the FastMCP app.
 
+    The payload only depends on values fixed for the process lifetime, so it is
+    built on the first read and the same dict is served afterwards. Building it
+    lazily keeps the git lookup off the server construction path.
+
     Args:
         app: The FastMCP application instance.
         config: The server configuration.
     """
     server_name = config.name
 
-    @app.resource(
-        f"{server_name}://server/info",
-        description=f"Server information for the {server_name} MCP server",
-        mime_type="application/json",
-    )
-    def server_info() -> dict[str, Any]:
-        """Get server information including version, git SHA, and advertised properties."""
+    @lru_cache(maxsize=1)
+    def _build_server_info() -> dict[str, Any]:
         info: dict[str, Any] = {
             "name": server_name,
             "fastmcp_version": _get_fastmcp_version(),
@@ -156,11 +170,18 @@ def _create_server_info_resource(
             info["package_name"] = config.package_name
             info["version"] = _get_package_version(config.package_name)
 
-        for key, value in config.advertised_properties.items():
-            info[key] = value
-
+        info.update(config.advertised_properties)
         return info
 
+    @app.resource(
+        f"{server_name}://server/info",
+        description=f"Server information for the {server_name} MCP server",
+        mime_type="application/json",
+    )
+    def server_info() -> dict[str, Any]:
+        """Get server information including version, git SHA, and advertised properties."""
+        return _build_server_info()
+
 
 def _discover_mcp_module_names() -> list[str]:
     """Auto-discover MCP module names from sibling non-private modules.
@@ -174,16 +195,8 @@ def _discover_mcp_module_names() -> list[str]:
     Returns:
         List of discovered MCP module names (excluding private modules starting with '_').
     """
-    # Get the caller's frame (skip this function and mcp_server)
-    frame = inspect.currentframe()
-    if frame is None:
-        return []
-
-    caller_frame = frame.f_back
-    if caller_frame is None:
-        return []
-
-    # Walk up the stack to find a frame outside this module
+    # Start at the caller (mcp_server) and walk up to a frame outside this module
+    caller_frame: FrameType | None = sys._getframe(1)
     while caller_frame is not None:
         caller_module = caller_frame.f_globals.get("__name__", "")
         if caller_module != __name__:
@@ -202,22 +215,45 @@ def _discover_mcp_module_names() -> list[str]:
         caller_module.rsplit(".", 1)[0] if "." in caller_module else caller_module
     )
 
-    # Try to get the package path
     try:
-        package = __import__(package_name, fromlist=[""])
-        package_path = getattr(package, "__path__", None)
-        if package_path is None:
-            return []
+        return list(_list_sibling_modules(package_name))
     except ImportError:
         return []
 
-    # Discover all non-private submodules
-    module_names: list[str] = []
-    for module_info in pkgutil.iter_modules(package_path):
-        if not module_info.name.startswith("_"):
-            module_names.append(module_info.name)
 
-    return sorted(module_names)
+@lru_cache(maxsize=None)
+def _list_sibling_modules(package_name: str) -> tuple[str, ...]:
+    """List the non-private submodules of a package, sorted by name.
+
+    The package layout does not change after import, so the directory scan is
+    done once per package. Import failures are raised rather than cached, so a
+    package that becomes importable later is still discovered.
+
+    Args:
+        package_name: The dotted name of the package to scan.
+
+    Returns:
+        Sorted tuple of submodule names, or an empty tuple if the module is not a
+        package.
+
+    Raises:
+        ImportError: If the package cannot be imported.
+    """
+    import pkgutil
+
+    package = __import__(package_name, fromlist=[""])
+
+    package_path = getattr(package, "__path__", None)
+    if package_path is None:
+        return ()
+
+    return tuple(
+        sorted(
+            module_info.name
+            for module_info in pkgutil.iter_modules(package_path)
+            if not module_info.name.startswith("_")
+        )
+    )
 
 
 def mcp_server(
@@ -330,13 +366,17 @@ def mcp_server(
 
     app.x_mcp_server_config = config  # type: ignore[attr-defined]
 
+    # Registered first so it wraps every other middleware, including tool filters
+    app.add_middleware(_RequestConfigCacheMiddleware())
+
     # Build the list of tool filters, including standard ones if requested
     all_tool_filters: list[ToolFilterFn] = list(tool_filters or [])
     if include_standard_tool_filters:
         all_tool_filters.extend(STANDARD_TOOL_FILTERS)
 
-    # Register tool filter middleware for each filter function
-    for filter_fn in all_tool_filters:
-        app.add_middleware(ToolFilterMiddleware(app, tool_filter=filter_fn))
+    # Register a single tool filter middleware for all filter functions, so each
+    # request pays for one tool pass / tool lookup rather than one per filter
+    if all_tool_filters:
+        app.add_middleware(ToolFilterMiddleware.from_filters(app, all_tool_filters))
 
     return app
@@ -14,20 +14,85 @@ credential resolution from HTTP headers and environment variables.
 from __future__ import annotations
 
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
-from fastmcp import Context, FastMCP
 from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
 
+if TYPE_CHECKING:
+    from fastmcp import Context, FastMCP
 
-@dataclass
+
+@dataclass(slots=True)
+class _RequestConfigCache:
+    """Config resolution state shared by all lookups within one MCP request.
+
+    Attributes:
+        values: Resolved values, keyed by config arg identity.
+    """
+
+    values: dict[int, str] = field(default_factory=dict)
+    _lowercase_headers: dict[str, str] | None = field(default=None, repr=False)
+
+    def lowercase_headers(self) -> dict[str, str]:
+        """Return the request headers keyed by lowercase name, built on first use."""
+        if self._lowercase_headers is None:
+            headers = get_http_headers() or {}
+            self._lowercase_headers = {
+                key.lower(): value for key, value in headers.items()
+            }
+        return self._lowercase_headers
+
+
+_RESOLVED_CONFIG_CACHE: ContextVar[_RequestConfigCache | None] = ContextVar(
+    "_mcp_resolved_config_cache", default=None
+)
+"""Config resolution cache for the MCP request currently being served.
+
+Set for the duration of each request by `_RequestConfigCacheMiddleware`.
+"""
+
+
+@contextmanager
+def _scoped_request_config_cache() -> Iterator[_RequestConfigCache]:
+    """Install a fresh config resolution cache until the block exits."""
+    request_cache = _RequestConfigCache()
+    token = _RESOLVED_CONFIG_CACHE.set(request_cache)
+    try:
+        yield request_cache
+    finally:
+        _RESOLVED_CONFIG_CACHE.reset(token)
+
+
+class _RequestConfigCacheMiddleware(Middleware):
+    """Middleware that scopes config resolution caching to each MCP request.
+
+    `mcp_server()` registers it ahead of any tool filter middleware, so filters
+    and handlers of one request share resolved values and one header fetch.
+    """
+
+    async def on_request(
+        self,
+        context: MiddlewareContext[Any],
+        call_next: CallNext[Any, Any],
+    ) -> Any:
+        """Run the rest of the chain with a fresh config resolution cache."""
+        with _scoped_request_config_cache():
+            return await call_next(context)
+
+
+@dataclass(slots=True, frozen=True)
 class MCPServerConfigArg:
     """Configuration argument for MCP server credential resolution.
 
     This class defines a configuration argument that can be resolved from
     HTTP headers or environment variables, with support for sensitive values.
+    Instances are immutable and hashable; use `dataclasses.replace()` to derive
+    a modified copy.
 
     Attributes:
         name: Unique name for this config argument (used for resolution).
@@ -52,9 +117,22 @@ class MCPServerConfigArg:
     required: bool = True
     sensitive: bool = False
     normalize_fn: Callable[[str], str | None] | None = None
+    _http_header_key_lower: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _env_only: bool = field(default=False, init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Precompute the lookup shape used during resolution."""
+        if self.http_header_key:
+            object.__setattr__(
+                self, "_http_header_key_lower", self.http_header_key.lower()
+            )
+        elif self.env_var and self.normalize_fn is None:
+            object.__setattr__(self, "_env_only", True)
 
-@dataclass
+
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for an MCP server created via mcp_server().
 
@@ -69,10 +147,12 @@ class MCPServerConfig:
     _config_args_by_name: dict[str, MCPServerConfigArg] = field(
         default_factory=dict, init=False, repr=False
     )
+    _any_header_args: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Build lookup dict for config args by name."""
         self._config_args_by_name = {arg.name: arg for arg in self.config_args}
+        self._any_header_args = any(arg.http_header_key for arg in self.config_args)
 
     def get_config(self, name: str) -> str:
         """Get a configuration value by name.
@@ -96,31 +176,91 @@ class MCPServerConfig:
             raise KeyError(f"Unknown config argument: {name}")
 
         config_arg = self._config_args_by_name[name]
-        return _resolve_config_arg(config_arg)
+        request_cache = _get_request_cache()
+        if request_cache is None:
+            return _resolve_config_arg(config_arg)
+
+        key = id(config_arg)
+        value = request_cache.values.get(key)
+        if value is None:
+            lowercase_headers = (
+                request_cache.lowercase_headers()
+                if config_arg._http_header_key_lower
+                else None
+            )
+            value = _resolve_config_arg(config_arg, lowercase_headers=lowercase_headers)
+            request_cache.values[key] = value
+        return value
 
+    def resolve_all(self) -> dict[str, str]:
+        """Resolve every registered config argument.
 
-def _get_header_value(headers: dict[str, str], header_name: str) -> str | None:
+        HTTP headers are fetched at most once for the whole batch, and not at all
+        when no argument reads from a header.
+
+        Returns:
+            A dict mapping each config argument name to its resolved value.
+
+        Raises:
+            ValueError: If a required config cannot be resolved.
+        """
+        if _get_request_cache() is not None:
+            return {arg.name: self.get_config(arg.name) for arg in self.config_args}
+
+        lowercase_headers: dict[str, str] | None = None
+        if self._any_header_args:
+            headers = get_http_headers() or {}
+            lowercase_headers = {key.lower(): value for key, value in headers.items()}
+        return {
+            arg.name: _resolve_config_arg(arg, lowercase_headers=lowercase_headers)
+            for arg in self.config_args
+        }
+
+
+def _get_request_cache() -> _RequestConfigCache | None:
+    """Return the config resolution cache for the current MCP request.
+
+    Values are keyed by config arg identity; the args are owned by the app, so
+    they outlive the request. Outside a request served through
+    `_RequestConfigCacheMiddleware` (direct calls, background tasks) None is
+    returned and every lookup resolves afresh.
+    """
+    return _RESOLVED_CONFIG_CACHE.get()
+
+
+def _get_header_value(headers: dict[str, str], header_name_lower: str) -> str | None:
     """Get a header value from a headers dict, case-insensitively.
 
+    FastMCP lowercases header names, so the direct lookup normally hits; the
+    scan only runs for dicts with mixed-case keys.
+
     Args:
         headers: Dictionary of HTTP headers.
-        header_name: The header name to look for (case-insensitive).
+        header_name_lower: The lowercased header name to look for.
 
     Returns:
         The header value if found, None otherwise.
     """
-    header_name_lower = header_name.lower()
+    value = headers.get(header_name_lower)
+    if value is not None:
+        return value
     for key, value in headers.items():
         if key.lower() == header_name_lower:
             return value
     return None
 
 
-def _resolve_config_arg(config_arg: MCPServerConfigArg) -> str:
+def _resolve_config_arg(
+    config_arg: MCPServerConfigArg,
+    *,
+    lowercase_headers: dict[str, str] | None = None,
+) -> str:
     """Resolve a single config argument from headers or environment.
 
     Args:
         config_arg: The config argument to resolve.
+        lowercase_headers: Request headers already keyed by lowercase name. When
+            omitted, headers are fetched and matched case-insensitively.
 
     Returns:
         The resolved value as a string.
@@ -129,28 +269,54 @@ def _resolve_config_arg(config_arg: MCPServerConfigArg) -> str:
         ValueError: If the config is required but no value can be resolved.
     """
 
-    def _apply_normalize(value: str) -> str | None:
-        """Apply normalize_fn if configured, otherwise return value as-is."""
-        if config_arg.normalize_fn is not None:
-            return config_arg.normalize_fn(value)
-        return value
+    if config_arg._env_only:
+        # Most args only read a single env var as-is; skip the general path.
+        env_value = os.environ.get(config_arg.env_var)  # type: ignore[arg-type]
+        return env_value if env_value else _resolve_config_fallback(config_arg)
+
+    normalize_fn = config_arg.normalize_fn
+
+    header_key_lower = config_arg._http_header_key_lower
+    if header_key_lower:
+        if lowercase_headers is not None:
+            header_value = lowercase_headers.get(header_key_lower)
+        else:
+            headers = get_http_headers()
+            header_value = (
+                _get_header_value(headers, header_key_lower) if headers else None
+            )
+        if header_value:
+            normalized = (
+                normalize_fn(header_value) if normalize_fn is not None else header_value
+            )
+            if normalized is not None:
+                return normalized
 
-    if config_arg.http_header_key:
-        headers = get_http_headers()
-        if headers:
-            header_value = _get_header_value(headers, config_arg.http_header_key)
-            if header_value:
-                normalized = _apply_normalize(header_value)
-                if normalized is not None:
-                    return normalized
-
-    if config_arg.env_var:
-        env_value = os.environ.get(config_arg.env_var)
+    env_var = config_arg.env_var
+    if env_var:
+        env_value = os.environ.get(env_var)
         if env_value:
-            normalized = _apply_normalize(env_value)
+            normalized = (
+                normalize_fn(env_value) if normalize_fn is not None else env_value
+            )
             if normalized is not None:
                 return normalized
 
+    return _resolve_config_fallback(config_arg)
+
+
+def _resolve_config_fallback(config_arg: MCPServerConfigArg) -> str:
+    """Resolve a config argument that was not found in headers or environment.
+
+    Args:
+        config_arg: The config argument to resolve.
+
+    Returns:
+        The default value, or an empty string for optional args without one.
+
+    Raises:
+        ValueError: If the config is required and has no default.
+    """
     if config_arg.default is not None:
         if callable(config_arg.default):
             return config_arg.default()
@@ -201,8 +367,8 @@ def get_mcp_config(ctx_or_app: Context | FastMCP, name: str) -> str:
             ...
         ```
     """
-    # Extract the FastMCP app from Context if needed
-    app = ctx_or_app.fastmcp if isinstance(ctx_or_app, Context) else ctx_or_app
+    # A Context exposes its app as `.fastmcp`; a FastMCP app has no such attribute
+    app = cast("FastMCP", getattr(ctx_or_app, "fastmcp", ctx_or_app))
 
     config: MCPServerConfig = app.x_mcp_server_config  # type: ignore[attr-defined]
     return config.get_config(name)
@@ -73,6 +73,26 @@ Example:
     ```
 """
 
+BoundToolFilter = Callable[[FastMCP], Callable[[Tool], bool]]
+"""Type alias for a filter's per-request binder.
+
+A tool filter function may expose a binder as its `__bind_request__` attribute.
+`ToolFilterMiddleware` calls the binder once per `list_tools` request with the
+FastMCP app and uses the returned predicate for every tool, so config values
+are read once per request instead of once per tool.
+
+Example:
+    ```python
+    def bind_readonly(app: FastMCP) -> Callable[[Tool], bool]:
+        if get_mcp_config(app, "readonly_mode") == "1":
+            return lambda tool: bool(get_annotation(tool, "readOnlyHint", False))
+        return lambda tool: True
+
+
+    readonly_filter.__bind_request__ = bind_readonly
+    ```
+"""
+
 # =============================================================================
 # Constants - Config Names
 # =============================================================================
@@ -340,11 +360,51 @@ def _parse_csv_config(value: str) -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def _allow_all_tools(tool: Tool) -> bool:
+    """Bound predicate that shows every tool."""
+    return True
+
+
+def _bind_request(
+    binder: BoundToolFilter,
+) -> Callable[[ToolFilterFn], ToolFilterFn]:
+    """Attach `binder` to a tool filter function as its `__bind_request__`."""
+
+    def decorator(filter_fn: ToolFilterFn) -> ToolFilterFn:
+        filter_fn.__bind_request__ = binder  # type: ignore[attr-defined]
+        return filter_fn
+
+    return decorator
+
+
 # =============================================================================
 # Standard Filter Functions
 # =============================================================================
 
 
+def _always_true(tool: Tool, app: FastMCP) -> bool:
+    """Tool filter that shows every tool."""
+    return True
+
+
+ALWAYS_TRUE: ToolFilterFn = _always_true
+"""Pass-through tool filter that shows every tool.
+
+`ToolFilterMiddleware` recognizes this sentinel by identity and skips filtering
+entirely: tool lists are returned unchanged and tool calls skip the tool lookup.
+Code that builds filters dynamically can return it when its config is unset.
+"""
+
+
+def _bind_readonly_mode(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `readonly_mode_filter` to the current request's config."""
+    config_value = get_mcp_config(app, CONFIG_READONLY_MODE).lower()
+    if config_value in ("1", "true"):
+        return lambda tool: bool(get_annotation(tool, ANNOTATION_READ_ONLY_HINT, False))
+    return _allow_all_tools
+
+
+@_bind_request(_bind_readonly_mode)
 def readonly_mode_filter(tool: Tool, app: FastMCP) -> bool:
     """Filter tools based on readonly_mode config.
 
@@ -364,6 +424,17 @@ def readonly_mode_filter(tool: Tool, app: FastMCP) -> bool:
     return True
 
 
+def _bind_no_destructive_tools(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `no_destructive_tools_filter` to the current request's config."""
+    config_value = get_mcp_config(app, CONFIG_NO_DESTRUCTIVE_TOOLS).lower()
+    if config_value in ("1", "true"):
+        return lambda tool: (
+            not bool(get_annotation(tool, ANNOTATION_DESTRUCTIVE_HINT, False))
+        )
+    return _allow_all_tools
+
+
+@_bind_request(_bind_no_destructive_tools)
 def no_destructive_tools_filter(tool: Tool, app: FastMCP) -> bool:
     """Filter tools based on no_destructive_tools config.
 
@@ -383,6 +454,50 @@ def no_destructive_tools_filter(tool: Tool, app: FastMCP) -> bool:
     return True
 
 
+_MODULE_FILTER_CONFLICT_MESSAGE = (
+    "Incompatible module filter configuration: both `exclude_modules` and "
+    "`include_modules` are set, but they are mutually exclusive. "
+    "Remediation: configure only one of them (clear the other) and restart "
+    "the server."
+)
+
+
+def _bind_module_filter(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `module_filter` to the current request's config.
+
+    Raises:
+        ValueError: If both exclude_modules and include_modules are set.
+    """
+    exclude_modules = frozenset(
+        _parse_csv_config(get_mcp_config(app, CONFIG_EXCLUDE_MODULES))
+    )
+    include_modules = frozenset(
+        _parse_csv_config(get_mcp_config(app, CONFIG_INCLUDE_MODULES))
+    )
+
+    if exclude_modules and include_modules:
+        raise ValueError(_MODULE_FILTER_CONFLICT_MESSAGE)
+
+    if exclude_modules:
+        # Hide tools from excluded modules
+        def _exclude(tool: Tool) -> bool:
+            tool_module = get_annotation(tool, ANNOTATION_MCP_MODULE, None)
+            return not (tool_module and tool_module in exclude_modules)
+
+        return _exclude
+
+    if include_modules:
+        # Only show tools from included modules
+        def _include(tool: Tool) -> bool:
+            tool_module = get_annotation(tool, ANNOTATION_MCP_MODULE, None)
+            return bool(tool_module and tool_module in include_modules)
+
+        return _include
+
+    return _allow_all_tools
+
+
+@_bind_request(_bind_module_filter)
 def module_filter(tool: Tool, app: FastMCP) -> bool:
     """Filter tools based on exclude_modules and include_modules config.
 
@@ -404,12 +519,7 @@ def module_filter(tool: Tool, app: FastMCP) -> bool:
     include_modules = _parse_csv_config(get_mcp_config(app, CONFIG_INCLUDE_MODULES))
 
     if exclude_modules and include_modules:
-        raise ValueError(
-            "Incompatible module filter configuration: both `exclude_modules` and "
-            "`include_modules` are set, but they are mutually exclusive. "
-            "Remediation: configure only one of them (clear the other) and restart "
-            "the server."
-        )
+        raise ValueError(_MODULE_FILTER_CONFLICT_MESSAGE)
 
     # Get the tool's mcp_module from annotations
     tool_module = get_annotation(tool, ANNOTATION_MCP_MODULE, None)
@@ -425,6 +535,17 @@ def module_filter(tool: Tool, app: FastMCP) -> bool:
     return True
 
 
+def _bind_tool_exclusion(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `tool_exclusion_filter` to the current request's config."""
+    exclude_tools = frozenset(
+        _parse_csv_config(get_mcp_config(app, CONFIG_EXCLUDE_TOOLS))
+    )
+    if exclude_tools:
+        return lambda tool: tool.name not in exclude_tools
+    return _allow_all_tools
+
+
+@_bind_request(_bind_tool_exclusion)
 def tool_exclusion_filter(tool: Tool, app: FastMCP) -> bool:
     """Filter tools based on exclude_tools config.
 
@@ -438,9 +559,23 @@ def tool_exclusion_filter(tool: Tool, app: FastMCP) -> bool:
         True if the tool should be visible, False to hide it.
     """
     exclude_tools = _parse_csv_config(get_mcp_config(app, CONFIG_EXCLUDE_TOOLS))
-    return not (exclude_tools and tool.name in exclude_tools)
+    return tool.name not in exclude_tools
+
+
+def _requires_client_filesystem(tool: Tool) -> bool:
+    """Return whether a tool is annotated `requiresClientFilesystem=True`."""
+    return bool(get_annotation(tool, ANNOTATION_REQUIRES_CLIENT_FILESYSTEM, False))
 
 
+def _bind_no_client_filesystem(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `no_client_filesystem_filter` to the current request's config."""
+    config_value = get_mcp_config(app, CONFIG_NO_CLIENT_FILESYSTEM).lower()
+    if config_value in ("1", "true"):
+        return lambda tool: not _requires_client_filesystem(tool)
+    return _allow_all_tools
+
+
+@_bind_request(_bind_no_client_filesystem)
 def no_client_filesystem_filter(tool: Tool, app: FastMCP) -> bool:
     """Filter tools based on `no_client_filesystem` config.
 
@@ -457,9 +592,7 @@ def no_client_filesystem_filter(tool: Tool, app: FastMCP) -> bool:
     """
     config_value = get_mcp_config(app, CONFIG_NO_CLIENT_FILESYSTEM).lower()
     if config_value in ("1", "true"):
-        return not bool(
-            get_annotation(tool, ANNOTATION_REQUIRES_CLIENT_FILESYSTEM, False)
-        )
+        return not _requires_client_filesystem(tool)
     return True
 
 
@@ -492,6 +625,14 @@ def is_trusted_execution_enabled(app: FastMCP) -> bool:
     return _is_truthy(get_mcp_config(app, CONFIG_TRUSTED_EXECUTION))
 
 
+def _bind_trusted_execution(app: FastMCP) -> Callable[[Tool], bool]:
+    """Bind `trusted_execution_filter` to the current request's config and transport."""
+    if is_trusted_execution_enabled(app) and not _is_http_transport_request():
+        return _allow_all_tools
+    return lambda tool: not _requires_client_filesystem(tool)
+
+
+@_bind_request(_bind_trusted_execution)
 def trusted_execution_filter(tool: Tool, app: FastMCP) -> bool:
     """Master gate hiding client-filesystem/exec tools unless trusted execution is on.
 
@@ -516,7 +657,7 @@ def trusted_execution_filter(tool: Tool, app: FastMCP) -> bool:
     """
     if is_trusted_execution_enabled(app) and not _is_http_transport_request():
         return True
-    return not bool(get_annotation(tool, ANNOTATION_REQUIRES_CLIENT_FILESYSTEM, False))
+    return not _requires_client_filesystem(tool)
 
 
 def assert_http_trusted_execution_disabled(app: FastMCP) -> None:
@@ -13,6 +13,7 @@ Submodules:
 
 from fastmcp_extensions.utils.describe_server import (
     ToolListMeasurement,
+    describe_tool_list,
     get_tool_details,
     measure_tool_list,
     measure_tool_list_detailed,
@@ -25,17 +26,23 @@ from fastmcp_extensions.utils.env import (
     get_env,
 )
 from fastmcp_extensions.utils.test_tool import (
+    MCPTestSession,
     call_mcp_tool,
+    call_mcp_tools_batch,
     find_free_port,
     list_mcp_tools,
+    run_batch_tool_test,
     run_http_tool_test,
     run_tool_test,
     wait_for_server,
 )
 
 __all__ = [
+    "MCPTestSession",
     "ToolListMeasurement",
     "call_mcp_tool",
+    "call_mcp_tools_batch",
+    "describe_tool_list",
     "find_free_port",
     "generate_markdown_docs",
     "get_env",
@@ -43,6 +50,7 @@ __all__ = [
     "list_mcp_tools",
     "measure_tool_list",
     "measure_tool_list_detailed",
+    "run_batch_tool_test",
     "run_http_tool_test",
     "run_measurement",
     "run_tool_test",
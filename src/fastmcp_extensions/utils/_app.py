@@ -0,0 +1,26 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+"""Helpers for loading a FastMCP app from a CLI argument."""
+
+from __future__ import annotations
+
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
+
+
+@lru_cache(maxsize=32)
+def _import_app(app_path: str) -> FastMCP:
+    """Import an app from a module:attribute path.
+
+    Results are cached per path, so repeated lookups return the same app instance.
+    """
+    if ":" not in app_path:
+        msg = f"Invalid app path '{app_path}'. Expected format: 'module.path:attribute'"
+        raise ValueError(msg)
+
+    module_path, attr_name = app_path.rsplit(":", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, attr_name)
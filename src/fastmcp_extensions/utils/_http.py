@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import asyncio
 import socket
+from urllib.parse import urlsplit
 
 from fastmcp import Client
 
 SERVER_STARTUP_TIMEOUT = 10.0
 POLL_INTERVAL = 0.2
+PORT_POLL_INTERVAL = 0.01
 
 
 def find_free_port() -> int:
@@ -19,12 +21,42 @@ def find_free_port() -> int:
         return s.getsockname()[1]
 
 
+async def _wait_port_open(host: str, port: int, deadline: float) -> bool:
+    """Wait until a TCP connection to host:port succeeds or the deadline passes."""
+    loop = asyncio.get_running_loop()
+    while loop.time() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(PORT_POLL_INTERVAL)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return True
+    return False
+
+
 async def wait_for_server(url: str, timeout: float = SERVER_STARTUP_TIMEOUT) -> bool:
-    """Wait for the MCP server to be ready by attempting to list tools."""
-    deadline = asyncio.get_event_loop().time() + timeout
-    while asyncio.get_event_loop().time() < deadline:
+    """Wait for the MCP server to be ready by attempting to list tools.
+
+    The port is probed with plain TCP connects first, so no MCP handshake is
+    attempted before the server is listening. A single client is then reused
+    across attempts; it reconnects on each `async with` after a failed connection.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    parts = urlsplit(url)
+    if (
+        parts.hostname
+        and parts.port
+        and not await _wait_port_open(parts.hostname, parts.port, deadline)
+    ):
+        return False
+
+    client = Client(url)
+    while loop.time() < deadline:
         try:
-            async with Client(url) as client:
+            async with client:
                 await client.list_tools()
                 return True
         except Exception:
@@ -17,7 +17,7 @@ Usage:
 
 Output includes:
     - Tool count
-    - Total characters (names + descriptions + schemas)
+    - Total characters (names + descriptions + compact JSON schemas)
     - Average characters per tool
 """
 
@@ -25,19 +25,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import importlib
+import json
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from fastmcp import Client
+from fastmcp import Client, FastMCP
+from fastmcp.utilities.versions import dedupe_with_versions
+
+from fastmcp_extensions.utils._app import _import_app
 
 if TYPE_CHECKING:
-    from fastmcp import FastMCP
+    from collections.abc import AsyncIterator
+
+    from mcp.types import Tool
 
 
-@dataclass
+@dataclass(frozen=True)
 class ToolListMeasurement:
-    """Measurement results for an MCP tool list."""
+    """Measurement results for an MCP tool list.
+
+    Instances are immutable, so the string rendering is computed once and cached.
+    """
 
     tool_count: int
     total_characters: int
@@ -46,6 +55,10 @@ class ToolListMeasurement:
 
     def __str__(self) -> str:
         """Return a human-readable string representation."""
+        return self._rendered
+
+    @cached_property
+    def _rendered(self) -> str:
         lines = []
         if self.server_name:
             lines.append(f"MCP Server: {self.server_name}")
@@ -55,113 +68,184 @@ class ToolListMeasurement:
         return "\n".join(lines)
 
 
-async def measure_tool_list(app: FastMCP) -> tuple[int, int]:
-    """Measure the tool list size from the MCP server.
+def _schema_len(schema: dict[str, Any]) -> int:
+    """Return the length of a schema serialized as compact JSON.
 
-    This function connects to the MCP server and measures the character count
-    of the tool list, including tool names, descriptions, and input schemas.
+    This matches what is sent to clients on the wire, unlike the Python repr.
+    """
+    return len(json.dumps(schema, separators=(",", ":"), ensure_ascii=False))
 
-    Args:
-        app: The FastMCP app instance
 
-    Returns:
-        Tuple of (tool_count, total_character_count)
+async def _list_tools(app: FastMCP) -> list[Tool]:
+    """Fetch the tool list as MCP clients would see it.
+
+    The tools are read from the in-process app and converted to their wire form
+    directly, skipping the client round-trip through the MCP protocol.
     """
+    tools = dedupe_with_versions(list(await app.list_tools()), lambda t: t.name)
+    return [tool.to_mcp_tool(name=tool.name) for tool in tools]
+
+
+async def _iter_tool_pages(app: FastMCP | str) -> AsyncIterator[list[Tool]]:
+    """Yield the tool list one page at a time over a single client session.
+
+    Unlike `Client.list_tools()`, only the current page is held in memory when
+    the server paginates its tool list. An in-process app is read directly and
+    yields a single page.
+    """
+    if isinstance(app, FastMCP):
+        yield await _list_tools(app)
+        return
+
     async with Client(app) as client:
-        tools = await client.list_tools()
+        cursor: str | None = None
+        seen_cursors: set[str] = set()
+        while True:
+            result = await client.list_tools_mcp(cursor=cursor)
+            yield result.tools
+            cursor = result.nextCursor
+            if not cursor or cursor in seen_cursors:
+                return
+            seen_cursors.add(cursor)
+
+
+async def _collect_tools(app: FastMCP | str) -> list[Tool]:
+    """Fetch the whole tool list, paging through a remote server if needed."""
+    return [tool async for page in _iter_tool_pages(app) for tool in page]
+
+
+def _measure_tools(tools: list[Tool]) -> tuple[int, int]:
+    """Return (tool_count, total_character_count) for an already-fetched tool list."""
+    total_chars = sum(
+        len(tool.name)
+        + (len(tool.description) if tool.description else 0)
+        + (_schema_len(tool.inputSchema) if tool.inputSchema else 0)
+        for tool in tools
+    )
+    return len(tools), total_chars
+
+
+def _tool_details(tools: list[Tool]) -> list[dict[str, Any]]:
+    """Return per-tool size details for an already-fetched tool list."""
+    details = []
+    for tool in tools:
+        name_len = len(tool.name)
+        desc_len = len(tool.description) if tool.description else 0
+        schema_len = _schema_len(tool.inputSchema) if tool.inputSchema else 0
+
+        details.append(
+            {
+                "name": tool.name,
+                "name_length": name_len,
+                "description_length": desc_len,
+                "schema_length": schema_len,
+                "total_length": name_len + desc_len + schema_len,
+            }
+        )
+
+    return details
+
+
+def _build_measurement(
+    tool_count: int,
+    total_chars: int,
+    server_name: str | None,
+) -> ToolListMeasurement:
+    """Build a ToolListMeasurement from raw totals."""
+    return ToolListMeasurement(
+        tool_count=tool_count,
+        total_characters=total_chars,
+        average_chars_per_tool=total_chars // tool_count if tool_count > 0 else 0,
+        server_name=server_name,
+    )
 
-        tool_count = len(tools)
-        total_chars = 0
 
-        for tool in tools:
-            total_chars += len(tool.name)
+async def measure_tool_list(app: FastMCP | str) -> tuple[int, int]:
+    """Measure the tool list size from the MCP server.
 
-            if tool.description:
-                total_chars += len(tool.description)
+    This function connects to the MCP server and measures the character count
+    of the tool list, including tool names, descriptions, and input schemas.
 
-            if tool.inputSchema:
-                total_chars += len(str(tool.inputSchema))
+    Args:
+        app: The FastMCP app instance, or the URL of a running MCP server
 
-        return tool_count, total_chars
+    Returns:
+        Tuple of (tool_count, total_character_count)
+    """
+    tool_count = 0
+    total_chars = 0
+    async for page in _iter_tool_pages(app):
+        page_count, page_chars = _measure_tools(page)
+        tool_count += page_count
+        total_chars += page_chars
+    return tool_count, total_chars
 
 
 async def measure_tool_list_detailed(
-    app: FastMCP,
+    app: FastMCP | str,
     server_name: str | None = None,
 ) -> ToolListMeasurement:
     """Measure the tool list size with detailed results.
 
     Args:
-        app: The FastMCP app instance
+        app: The FastMCP app instance, or the URL of a running MCP server
         server_name: Optional name of the server for reporting
 
     Returns:
         ToolListMeasurement with detailed results
     """
     tool_count, total_chars = await measure_tool_list(app)
+    return _build_measurement(tool_count, total_chars, server_name)
 
-    return ToolListMeasurement(
-        tool_count=tool_count,
-        total_characters=total_chars,
-        average_chars_per_tool=total_chars // tool_count if tool_count > 0 else 0,
-        server_name=server_name,
-    )
+
+async def describe_tool_list(
+    app: FastMCP | str,
+    server_name: str | None = None,
+) -> tuple[ToolListMeasurement, list[dict[str, Any]]]:
+    """Measure the tool list and collect per-tool details in one pass.
+
+    Equivalent to calling `measure_tool_list_detailed()` and `get_tool_details()`,
+    but connects to the server and lists tools only once.
+
+    Args:
+        app: The FastMCP app instance, or the URL of a running MCP server
+        server_name: Optional name of the server for reporting
+
+    Returns:
+        Tuple of (ToolListMeasurement, per-tool details as returned by
+        `get_tool_details()`)
+    """
+    details = _tool_details(await _collect_tools(app))
+    # Derive the totals from the details so each schema is serialized only once
+    total_chars = sum(detail["total_length"] for detail in details)
+    measurement = _build_measurement(len(details), total_chars, server_name)
+    return measurement, details
 
 
-def run_measurement(app: FastMCP, server_name: str | None = None) -> None:
+def run_measurement(app: FastMCP | str, server_name: str | None = None) -> None:
     """Run tool list measurement and print results.
 
     This is a convenience function for CLI measurement scripts.
 
     Args:
-        app: The FastMCP app instance
+        app: The FastMCP app instance, or the URL of a running MCP server
         server_name: Optional name of the server for reporting
     """
     measurement = asyncio.run(measure_tool_list_detailed(app, server_name))
     print(str(measurement))
 
 
-async def get_tool_details(app: FastMCP) -> list[dict[str, Any]]:
+async def get_tool_details(app: FastMCP | str) -> list[dict[str, Any]]:
     """Get detailed information about each tool.
 
     Args:
-        app: The FastMCP app instance
+        app: The FastMCP app instance, or the URL of a running MCP server
 
     Returns:
         List of dictionaries with tool details including name, description length,
         and schema length for each tool.
     """
-    async with Client(app) as client:
-        tools = await client.list_tools()
-
-        details = []
-        for tool in tools:
-            name_len = len(tool.name)
-            desc_len = len(tool.description) if tool.description else 0
-            schema_len = len(str(tool.inputSchema)) if tool.inputSchema else 0
-
-            details.append(
-                {
-                    "name": tool.name,
-                    "name_length": name_len,
-                    "description_length": desc_len,
-                    "schema_length": schema_len,
-                    "total_length": name_len + desc_len + schema_len,
-                }
-            )
-
-        return details
-
-
-def _import_app(app_path: str) -> FastMCP:
-    """Import an app from a module:attribute path."""
-    if ":" not in app_path:
-        msg = f"Invalid app path '{app_path}'. Expected format: 'module.path:attribute'"
-        raise ValueError(msg)
-
-    module_path, attr_name = app_path.rsplit(":", 1)
-    module = importlib.import_module(module_path)
-    return getattr(module, attr_name)
+    return _tool_details(await _collect_tools(app))
 
 
 def main() -> None:
@@ -15,6 +15,13 @@ Usage (stdio transport):
         cmd = "python -m fastmcp_extensions.utils.test_tool --app my_mcp_server.server:app"
         help = "Test MCP tools with JSON arguments"
 
+Usage (batch, stdio transport):
+    python -m fastmcp_extensions.utils.test_tool --app <module:app> --batch <calls.jsonl>
+
+    Each non-blank line of the batch file is a JSON object such as
+    `{"tool": "get_version", "args": {}}`. All calls share one client session and
+    run concurrently (see `--max-concurrent`); results are printed as a JSON list.
+
 Usage (HTTP transport):
     python -m fastmcp_extensions.utils.test_tool --http --app <module:app> [tool_name] ['<json_args>']
 
@@ -32,31 +39,151 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import importlib
 import json
 import os
+import socket
 import sys
-import threading
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from fastmcp import Client
 
+from fastmcp_extensions.utils._app import _import_app
 from fastmcp_extensions.utils._http import find_free_port, wait_for_server
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from fastmcp import FastMCP
 
+DEFAULT_MAX_CONCURRENT = 4
+
+
+class MCPTestSession:
+    """A client session that can be reused for several tool calls.
+
+    `call_mcp_tool()` and `list_mcp_tools()` connect and disconnect on every
+    call. Use this session instead when driving multiple calls, so the MCP
+    handshake happens once.
+
+    Args:
+        app: The FastMCP app instance, or the URL of a running MCP server.
+
+    Example:
+        ```python
+        async with MCPTestSession(app) as session:
+            tools = await session.list_tools()
+            for tool in tools:
+                print(await session.call_tool(tool.name, {}))
+        ```
+    """
+
+    def __init__(self, app: FastMCP | str) -> None:
+        """Initialize the session without connecting."""
+        self._client = Client(app)
+
+    async def __aenter__(self) -> MCPTestSession:
+        """Connect to the server."""
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Disconnect from the server."""
+        await self._client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def call_tool(self, tool_name: str, args: dict[str, Any]) -> object:
+        """Call an MCP tool over the open session."""
+        return await self._client.call_tool(tool_name, args)
+
+    async def list_tools(self) -> list[Any]:
+        """List all available MCP tools over the open session."""
+        return await self._client.list_tools()
+
 
 async def call_mcp_tool(app: FastMCP, tool_name: str, args: dict[str, Any]) -> object:
     """Call an MCP tool using the FastMCP client."""
-    async with Client(app) as client:
-        return await client.call_tool(tool_name, args)
+    async with MCPTestSession(app) as session:
+        return await session.call_tool(tool_name, args)
 
 
 async def list_mcp_tools(app: FastMCP) -> list[Any]:
     """List all available MCP tools."""
-    async with Client(app) as client:
-        return await client.list_tools()
+    async with MCPTestSession(app) as session:
+        return await session.list_tools()
+
+
+async def call_mcp_tools_batch(
+    app: FastMCP,
+    calls: Sequence[tuple[str, dict[str, Any]]],
+    *,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+) -> list[dict[str, Any]]:
+    """Call several MCP tools over one client session.
+
+    Calls run concurrently, at most `max_concurrent` at a time. A failing call
+    does not stop the others; its error is reported in its result entry.
+
+    Args:
+        app: The FastMCP app instance.
+        calls: Sequence of (tool_name, args) pairs.
+        max_concurrent: Maximum number of calls in flight at once.
+
+    Returns:
+        One dict per call, in input order, with the tool name and either a
+        JSON-friendly `result` (see `_result_payload()`) or an `error` string.
+
+    Raises:
+        ValueError: If `max_concurrent` is less than 1.
+    """
+    _check_max_concurrent(max_concurrent)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async with MCPTestSession(app) as session:
+
+        async def _call(tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await session.call_tool(tool_name, args)
+                except Exception as e:
+                    return {"tool": tool_name, "error": str(e)}
+            return {"tool": tool_name, "result": _result_payload(result)}
+
+        return list(await asyncio.gather(*(_call(name, args) for name, args in calls)))
+
+
+def _check_max_concurrent(max_concurrent: int) -> None:
+    """Reject concurrency limits that would deadlock or break the semaphore."""
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+
+def _format_result(result: object) -> str:
+    """Render a tool call result for printing."""
+    if hasattr(result, "text"):
+        return str(result.text)
+    return str(result)
+
+
+def _result_payload(result: object) -> Any:
+    """Return the data of a tool call result for JSON output.
+
+    Prefers the deserialized `data`, then the structured content, and falls back
+    to the text content blocks joined by newlines.
+    """
+    data = getattr(result, "data", None)
+    if data is not None:
+        return data
+    structured_content = getattr(result, "structured_content", None)
+    if structured_content is not None:
+        return structured_content
+    return "\n".join(
+        block.text for block in getattr(result, "content", ()) if hasattr(block, "text")
+    )
 
 
 def run_tool_test(
@@ -67,11 +194,79 @@ def run_tool_test(
     """Run a tool test with JSON arguments and print the result."""
     args: dict[str, Any] = json.loads(json_args)
     result = asyncio.run(call_mcp_tool(app, tool_name, args))
+    print(_format_result(result))
 
-    if hasattr(result, "text"):
-        print(result.text)
-    else:
-        print(str(result))
+
+def run_batch_tool_test(
+    app: FastMCP,
+    batch_path: str,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+) -> int:
+    """Run the tool calls listed in a JSONL file and print the results as JSON.
+
+    Args:
+        app: The FastMCP app instance.
+        batch_path: Path to a file with one `{"tool": ..., "args": {...}}` object
+            per line. Blank lines are ignored.
+        max_concurrent: Maximum number of calls in flight at once.
+
+    Returns:
+        0 if every call succeeded, 1 otherwise.
+
+    Raises:
+        ValueError: If `max_concurrent` is less than 1, or a line of the batch
+            file is not a valid tool call.
+        OSError: If the batch file cannot be read.
+    """
+    _check_max_concurrent(max_concurrent)
+    calls = _load_batch_calls(batch_path)
+    return _print_batch_results(app, calls, max_concurrent=max_concurrent)
+
+
+def _load_batch_calls(batch_path: str) -> list[tuple[str, dict[str, Any]]]:
+    """Read the (tool_name, args) pairs from a JSONL batch file.
+
+    Raises:
+        ValueError: If a line is not JSON, not an object, has no string `tool`,
+            or has `args` that are not an object. The message names the line.
+        OSError: If the batch file cannot be read.
+    """
+    calls: list[tuple[str, dict[str, Any]]] = []
+    with open(batch_path, encoding="utf-8") as batch_file:
+        for line_number, line in enumerate(batch_file, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"{batch_path}:{line_number}: invalid JSON: {e}"
+                ) from e
+            if not isinstance(entry, dict) or not isinstance(entry.get("tool"), str):
+                raise ValueError(
+                    f'{batch_path}:{line_number}: expected an object with a "tool" name'
+                )
+            args = entry.get("args", {})
+            if not isinstance(args, dict):
+                raise ValueError(
+                    f'{batch_path}:{line_number}: "args" must be an object'
+                )
+            calls.append((entry["tool"], args))
+    return calls
+
+
+def _print_batch_results(
+    app: FastMCP,
+    calls: Sequence[tuple[str, dict[str, Any]]],
+    *,
+    max_concurrent: int,
+) -> int:
+    """Run the batch, print its results as JSON, and return the exit code."""
+    results = asyncio.run(
+        call_mcp_tools_batch(app, calls, max_concurrent=max_concurrent)
+    )
+    print(json.dumps(results, indent=2, default=str))
+    return 1 if any("error" in result for result in results) else 0
 
 
 async def run_http_tool_test(
@@ -83,35 +278,45 @@ async def run_http_tool_test(
     """Run a tool test over HTTP transport using the app directly."""
     import uvicorn
 
+    sockets: list[socket.socket] | None = None
     if port is None:
-        port = find_free_port()
+        # Bind the listening socket here and hand it to uvicorn, so the port
+        # cannot be taken by another process between choosing and binding it.
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sockets = [sock]
 
     url = f"http://127.0.0.1:{port}/mcp"
     os.environ["MCP_HTTP_PORT"] = str(port)
 
     print(f"Starting HTTP server on port {port}...", file=sys.stderr)
 
-    server_error: Exception | None = None
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app.http_app(),
+            host="127.0.0.1",
+            port=port,
+            log_level="error",
+            lifespan="on",
+        )
+    )
+    server_error: BaseException | None = None
 
-    def run_server() -> None:
+    async def serve() -> None:
         nonlocal server_error
         try:
-            uvicorn.run(
-                app.http_app(),
-                host="127.0.0.1",
-                port=port,
-                log_level="error",
-            )
-        except Exception as e:
+            await server.serve(sockets=sockets)
+        except (Exception, SystemExit) as e:
+            # uvicorn exits via sys.exit() when startup fails (e.g. port in use)
             server_error = e
 
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
+    server_task = asyncio.create_task(serve())
 
     try:
         if not await wait_for_server(url):
             if server_error:
-                print(f"Server error: {server_error}", file=sys.stderr)
+                print(f"Server error: {server_error!r}", file=sys.stderr)
             print(f"Server failed to start on port {port}", file=sys.stderr)
             return 1
 
@@ -123,26 +328,15 @@ async def run_http_tool_test(
                 print(f"Calling tool: {tool_name}", file=sys.stderr)
                 result = await client.call_tool(tool_name, args or {})
 
-                if hasattr(result, "text"):
-                    print(result.text)
-                else:
-                    print(str(result))
+                print(_format_result(result))
 
         return 0
 
     finally:
-        pass
-
-
-def _import_app(app_path: str) -> object:
-    """Import an app from a module:attribute path."""
-    if ":" not in app_path:
-        msg = f"Invalid app path '{app_path}'. Expected format: 'module.path:attribute'"
-        raise ValueError(msg)
-
-    module_path, attr_name = app_path.rsplit(":", 1)
-    module = importlib.import_module(module_path)
-    return getattr(module, attr_name)
+        server.should_exit = True
+        await server_task
+        for sock in sockets or ():
+            sock.close()
 
 
 def main() -> None:
@@ -163,6 +357,17 @@ def main() -> None:
         action="store_true",
         help="Use HTTP transport instead of stdio",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="JSONL file of tool calls to run over one session (stdio transport only)",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT,
+        help="Maximum number of concurrent calls in batch mode",
+    )
     parser.add_argument(
         "tool_name",
         nargs="?",
@@ -177,8 +382,31 @@ def main() -> None:
 
     cli_args = parser.parse_args()
 
+    if cli_args.batch and cli_args.http:
+        parser.error("--batch is only supported with the stdio transport")
+    if cli_args.max_concurrent < 1:
+        parser.error("--max-concurrent must be at least 1")
+
+    batch_calls: list[tuple[str, dict[str, Any]]] | None = None
+    if cli_args.batch:
+        try:
+            batch_calls = _load_batch_calls(cli_args.batch)
+        except ValueError as e:
+            parser.error(str(e))
+        except OSError as e:
+            parser.error(f"cannot read --batch file: {e}")
+
     app = _import_app(cli_args.app)
 
+    if batch_calls is not None:
+        sys.exit(
+            _print_batch_results(
+                app,
+                batch_calls,
+                max_concurrent=cli_args.max_concurrent,
+            )
+        )
+
     if cli_args.http:
         # HTTP transport mode
         tool_args = json.loads(cli_args.json_args) if cli_args.tool_name else None
@@ -199,9 +427,12 @@ def main() -> None:
 
 
 __all__ = [
+    "MCPTestSession",
     "call_mcp_tool",
+    "call_mcp_tools_batch",
     "find_free_port",
     "list_mcp_tools",
+    "run_batch_tool_test",
     "run_http_tool_test",
     "run_tool_test",
     "wait_for_server",
@@ -0,0 +1,118 @@
+# Copyright (c) 2026 Airbyte, Inc., all rights reserved.
+"""Unit tests for `fastmcp_extensions.utils.describe_server`.
+
+These tests run against small in-process FastMCP apps. Remote-server coverage
+serves the same app from this process on a localhost port.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+import uvicorn
+from fastmcp import Client, FastMCP
+
+from fastmcp_extensions import mcp_server
+from fastmcp_extensions.utils._http import find_free_port
+from fastmcp_extensions.utils.describe_server import (
+    _measure_tools,
+    describe_tool_list,
+    get_tool_details,
+    measure_tool_list_detailed,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _filtered_versioned_app(**fastmcp_kwargs: object) -> FastMCP:
+    """Build an app with a readonly filter and two versions of one tool."""
+    app = mcp_server(
+        "describe-test", include_standard_tool_filters=True, **fastmcp_kwargs
+    )
+
+    @app.tool(name="lookup", version="1.0", annotations={"readOnlyHint": True})
+    def lookup_v1(query: str) -> str:
+        """Look up a record."""
+        return query
+
+    @app.tool(name="lookup", version="2.0", annotations={"readOnlyHint": True})
+    def lookup_v2(query: str, limit: int = 10) -> str:
+        """Look up records, returning at most `limit` of them."""
+        return query
+
+    @app.tool()
+    def write_record(query: str) -> str:
+        """Write a record."""
+        return query
+
+    return app
+
+
+@asynccontextmanager
+async def _serve_http(app: FastMCP) -> AsyncIterator[str]:
+    """Serve the app over HTTP on a free localhost port and yield its MCP URL."""
+    port = find_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app.http_app(), host="127.0.0.1", port=port, log_level="error")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("readonly_mode", ["0", "1"])
+async def test_measure_tool_list_matches_client_round_trip(
+    monkeypatch: pytest.MonkeyPatch,
+    readonly_mode: str,
+) -> None:
+    """Test that the in-process listing measures what an MCP client receives."""
+    monkeypatch.setenv("MCP_READONLY_MODE", readonly_mode)
+    app = _filtered_versioned_app()
+
+    measurement = await measure_tool_list_detailed(app)
+    async with Client(app) as client:
+        client_count, client_chars = _measure_tools(await client.list_tools())
+
+    assert measurement.tool_count == client_count
+    assert measurement.total_characters == client_chars
+    assert measurement.tool_count == (1 if readonly_mode == "1" else 2)
+
+
+@pytest.mark.asyncio
+async def test_describe_tool_list_matches_separate_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the one-pass description equals the two separate helpers."""
+    monkeypatch.setenv("MCP_READONLY_MODE", "0")
+    app = _filtered_versioned_app()
+
+    measurement, details = await describe_tool_list(app, server_name="describe-test")
+
+    assert measurement == await measure_tool_list_detailed(
+        app, server_name="describe-test"
+    )
+    assert details == await get_tool_details(app)
+
+
+@pytest.mark.asyncio
+async def test_describe_helpers_accept_a_server_url(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that every describe helper reads a paginated remote server too."""
+    monkeypatch.setenv("MCP_READONLY_MODE", "0")
+    app = _filtered_versioned_app(list_page_size=1)
+    in_process = await describe_tool_list(app)
+
+    async with _serve_http(app) as url:
+        assert await describe_tool_list(url) == in_process
+        assert await get_tool_details(url) == in_process[1]
+        assert await measure_tool_list_detailed(url) == in_process[0]
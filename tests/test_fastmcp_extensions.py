@@ -1,6 +1,9 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 """Unit tests for the fastmcp_extensions module."""
 
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import pytest
 from fastmcp import FastMCP
 from fastmcp.server.providers import Provider
@@ -23,13 +26,24 @@ from fastmcp_extensions.annotations import (
 )
 from fastmcp_extensions.decorators import (
     _REGISTERED_PROMPTS,
+    _REGISTERED_PROMPTS_BY_MODULE,
     _REGISTERED_PROVIDERS,
     _REGISTERED_RESOURCES,
+    _REGISTERED_RESOURCES_BY_MODULE,
     _REGISTERED_TOOLS,
+    _REGISTERED_TOOLS_BY_MODULE,
     _clear_registrations,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clean_registrations() -> Iterator[None]:
+    """Start and end every test with empty decorator registries."""
+    _clear_registrations()
+    yield
+    _clear_registrations()
+
+
 @pytest.mark.parametrize(
     "constant,expected_value",
     [
@@ -45,10 +59,15 @@ def test_annotation_constants(constant: str, expected_value: str) -> None:
     assert constant == expected_value
 
 
-@pytest.mark.unit
-def test_all_exports() -> None:
-    """Test that __all__ contains expected exports."""
-    expected_exports = [
+@pytest.fixture(scope="module")
+def all_exports() -> frozenset[str]:
+    """Snapshot of `fastmcp_extensions.__all__` for membership checks."""
+    return frozenset(fastmcp_extensions.__all__)
+
+
+@pytest.mark.parametrize(
+    "symbol",
+    [
         "mcp_tool",
         "mcp_provider",
         "mcp_prompt",
@@ -56,36 +75,20 @@ def test_all_exports() -> None:
         "register_mcp_tools",
         "register_mcp_prompts",
         "register_mcp_resources",
-    ]
-    assert hasattr(fastmcp_extensions, "__all__")
-    for item in expected_exports:
-        assert item in fastmcp_extensions.__all__, f"Missing export: {item}"
-
-
+        "ToolFilterFn",
+        "BoundToolFilter",
+        "ALWAYS_TRUE",
+    ],
+)
 @pytest.mark.unit
-def test_mcp_tool_decorator() -> None:
-    """Test that mcp_tool decorator registers tools with auto-inferred mcp_module."""
-    _clear_registrations()
-
-    @mcp_tool(read_only=True)
-    def my_test_tool() -> str:
-        """A test tool."""
-        return "test"
-
-    assert len(_REGISTERED_TOOLS) == 1
-    func, annotations = _REGISTERED_TOOLS[0]
-    assert func.__name__ == "my_test_tool"
-    # mcp_module is auto-inferred from module name (test_fastmcp_extensions)
-    assert annotations["mcp_module"] == "test_fastmcp_extensions"
-    assert annotations[READ_ONLY_HINT] is True
-
-    _clear_registrations()
+def test_all_exports(all_exports: frozenset[str], symbol: str) -> None:
+    """Test that __all__ contains expected exports."""
+    assert symbol in all_exports, f"Missing export: {symbol}"
 
 
 @pytest.mark.unit
 def test_mcp_provider_decorator() -> None:
     """Test that mcp_provider decorator registers provider factories."""
-    _clear_registrations()
 
     class TestProvider(Provider):
         pass
@@ -101,8 +104,6 @@ def test_mcp_provider_decorator() -> None:
     assert annotations["mcp_module"] == "test_fastmcp_extensions"
     assert annotations["interactive-ui"] is True
 
-    _clear_registrations()
-
 
 @pytest.mark.asyncio
 @pytest.mark.unit
@@ -110,7 +111,6 @@ async def test_register_mcp_tools_registers_providers_with_missing_annotations()
     None
 ):
     """Test that provider annotations fill missing provider tool annotations."""
-    _clear_registrations()
 
     class TestProvider(Provider):
         async def _list_tools(self) -> list[Tool]:
@@ -152,35 +152,26 @@ async def test_register_mcp_tools_registers_providers_with_missing_annotations()
         "provider-owned": True,
     }
 
-    _clear_registrations()
 
+def _define_test_tool() -> Callable[..., Any]:
+    @mcp_tool(read_only=True)
+    def my_test_tool() -> str:
+        """A test tool."""
+        return "test"
+
+    return my_test_tool
 
-@pytest.mark.unit
-def test_mcp_prompt_decorator() -> None:
-    """Test that mcp_prompt decorator registers prompts with auto-inferred mcp_module."""
-    _clear_registrations()
 
+def _define_test_prompt() -> Callable[..., Any]:
     @mcp_prompt("test_prompt", "A test prompt")
     def my_test_prompt() -> list[dict[str, str]]:
         """A test prompt."""
         return [{"role": "user", "content": "Hello"}]
 
-    assert len(_REGISTERED_PROMPTS) == 1
-    func, annotations = _REGISTERED_PROMPTS[0]
-    assert func.__name__ == "my_test_prompt"
-    assert annotations["name"] == "test_prompt"
-    assert annotations["description"] == "A test prompt"
-    # mcp_module is auto-inferred from module name (test_fastmcp_extensions)
-    assert annotations["mcp_module"] == "test_fastmcp_extensions"
-
-    _clear_registrations()
+    return my_test_prompt
 
 
-@pytest.mark.unit
-def test_mcp_resource_decorator() -> None:
-    """Test that mcp_resource decorator registers resources with auto-inferred mcp_module."""
-    _clear_registrations()
-
+def _define_test_resource() -> Callable[..., Any]:
     @mcp_resource(
         uri="test://resource",
         description="A test resource",
@@ -190,13 +181,120 @@ def test_mcp_resource_decorator() -> None:
         """A test resource."""
         return {"key": "value"}
 
-    assert len(_REGISTERED_RESOURCES) == 1
-    func, annotations = _REGISTERED_RESOURCES[0]
-    assert func.__name__ == "my_test_resource"
-    assert annotations["uri"] == "test://resource"
-    assert annotations["description"] == "A test resource"
-    assert annotations["mime_type"] == "application/json"
+    return my_test_resource
+
+
+@pytest.mark.parametrize(
+    "define,registry,registry_by_module,expected_annotations",
+    [
+        pytest.param(
+            _define_test_tool,
+            _REGISTERED_TOOLS,
+            _REGISTERED_TOOLS_BY_MODULE,
+            {READ_ONLY_HINT: True},
+            id="tool",
+        ),
+        pytest.param(
+            _define_test_prompt,
+            _REGISTERED_PROMPTS,
+            _REGISTERED_PROMPTS_BY_MODULE,
+            {"name": "test_prompt", "description": "A test prompt"},
+            id="prompt",
+        ),
+        pytest.param(
+            _define_test_resource,
+            _REGISTERED_RESOURCES,
+            _REGISTERED_RESOURCES_BY_MODULE,
+            {
+                "uri": "test://resource",
+                "description": "A test resource",
+                "mime_type": "application/json",
+            },
+            id="resource",
+        ),
+    ],
+)
+@pytest.mark.unit
+def test_mcp_decorator_registers_with_inferred_module(
+    define: Callable[[], Callable[..., Any]],
+    registry: list[tuple[Callable[..., Any], dict[str, Any]]],
+    registry_by_module: dict[str, list[tuple[Callable[..., Any], dict[str, Any]]]],
+    expected_annotations: dict[str, Any],
+) -> None:
+    """Test that mcp_tool/mcp_prompt/mcp_resource register with auto-inferred mcp_module."""
+
+    func = define()
+
+    assert len(registry) == 1
+    registered_func, annotations = registry[0]
+    assert registered_func is func
     # mcp_module is auto-inferred from module name (test_fastmcp_extensions)
     assert annotations["mcp_module"] == "test_fastmcp_extensions"
+    for key, value in expected_annotations.items():
+        assert annotations[key] == value
+    assert registry_by_module["test_fastmcp_extensions"] == [(func, annotations)]
 
     _clear_registrations()
+    assert not registry
+    assert not registry_by_module
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_register_mcp_tools_exclude_args() -> None:
+    """Test that exclude_args hides matching parameters from tool schemas."""
+
+    @mcp_tool(read_only=True)
+    def tool_with_workspace(query: str, workspace_id: str = "") -> str:
+        """A tool with an injected argument."""
+        return query
+
+    @mcp_tool(read_only=True)
+    def tool_without_workspace(query: str) -> str:
+        """A tool without the injected argument."""
+        return query
+
+    app = FastMCP("test")
+    register_mcp_tools(
+        app,
+        mcp_module="test_fastmcp_extensions",
+        exclude_args=["workspace_id"],
+    )
+
+    with_workspace = await app.get_tool("tool_with_workspace")
+    without_workspace = await app.get_tool("tool_without_workspace")
+    assert with_workspace is not None
+    assert without_workspace is not None
+    assert set(with_workspace.parameters["properties"]) == {"query"}
+    assert set(without_workspace.parameters["properties"]) == {"query"}
+
+
+@pytest.mark.unit
+def test_register_mcp_tools_exclude_args_keeps_caller_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that exclude_args reach app.tool() in the order the caller gave."""
+
+    @mcp_tool(read_only=True)
+    def tool_with_injected(
+        query: str, workspace_id: str = "", user_id: str = ""
+    ) -> str:
+        """A tool with several injected arguments."""
+        return query
+
+    app = FastMCP("test")
+    seen: list[list[str] | None] = []
+    original_tool = app.tool
+
+    def recording_tool(fn: Any, **kwargs: Any) -> Any:
+        seen.append(kwargs.get("exclude_args"))
+        return original_tool(fn, **kwargs)
+
+    monkeypatch.setattr(app, "tool", recording_tool)
+    register_mcp_tools(
+        app,
+        mcp_module="test_fastmcp_extensions",
+        exclude_args=["user_id", "missing", "workspace_id", "user_id"],
+    )
+
+    assert seen == [["user_id", "workspace_id"]]
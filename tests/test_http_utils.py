@@ -0,0 +1,129 @@
+# Copyright (c) 2026 Airbyte, Inc., all rights reserved.
+"""Unit tests for `fastmcp_extensions.utils._http`.
+
+The servers here listen on an ephemeral localhost port, so the tests need no
+network access beyond the loopback interface.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar
+
+import pytest
+import pytest_asyncio
+import uvicorn
+from fastmcp import FastMCP
+
+from fastmcp_extensions.utils import _http
+from fastmcp_extensions.utils._http import find_free_port, wait_for_server
+
+pytestmark = pytest.mark.unit
+
+
+@pytest_asyncio.fixture
+async def running_server_url() -> AsyncIterator[str]:
+    """Serve a one-tool app over HTTP and yield its MCP endpoint URL."""
+    app = FastMCP("http-utils-test")
+
+    @app.tool()
+    def ping() -> str:
+        """Return pong."""
+        return "pong"
+
+    port = find_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app.http_app(), host="127.0.0.1", port=port, log_level="error")
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        server.should_exit = True
+        await server_task
+
+
+class _FlakyClient:
+    """Client stand-in whose first connection attempt is refused."""
+
+    instances: ClassVar[list[_FlakyClient]] = []
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.enter_count = 0
+        _FlakyClient.instances.append(self)
+
+    async def __aenter__(self) -> _FlakyClient:
+        self.enter_count += 1
+        if self.enter_count == 1:
+            raise ConnectionRefusedError("connection refused")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def list_tools(self) -> list[Any]:
+        return []
+
+
+@pytest.mark.asyncio
+async def test_wait_for_server_succeeds_for_running_server(
+    running_server_url: str,
+) -> None:
+    """Test that a server that is already up is reported ready at once."""
+    started = time.monotonic()
+
+    assert await wait_for_server(running_server_url, timeout=5.0) is True
+    assert time.monotonic() - started < 2.0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_server_times_out_on_closed_port() -> None:
+    """Test that a closed port gives False once the timeout has passed."""
+    url = f"http://127.0.0.1:{find_free_port()}/mcp"
+    timeout = 0.3
+    started = time.monotonic()
+
+    assert await wait_for_server(url, timeout=timeout) is False
+
+    elapsed = time.monotonic() - started
+    assert timeout <= elapsed < timeout + 0.5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_server_reuses_client_after_refused_connect(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a refused MCP connect is retried by re-entering the same client."""
+    monkeypatch.setattr(_http, "Client", _FlakyClient)
+    monkeypatch.setattr(_http, "POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(_FlakyClient, "instances", [])
+
+    port = find_free_port()
+
+    async def _accept(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        writer.close()
+
+    async def _listen_later() -> asyncio.Server:
+        # The TCP probe sees a refused connection before the port opens
+        await asyncio.sleep(0.05)
+        return await asyncio.start_server(_accept, "127.0.0.1", port)
+
+    listen_task = asyncio.create_task(_listen_later())
+    try:
+        url = f"http://127.0.0.1:{port}/mcp"
+        assert await wait_for_server(url, timeout=5.0) is True
+    finally:
+        listener = await listen_task
+        listener.close()
+        await listener.wait_closed()
+
+    (client,) = _FlakyClient.instances
+    assert client.url == url
+    assert client.enter_count == 2
@@ -1,15 +1,17 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 """Unit tests for the ToolFilterMiddleware."""
 
-from collections.abc import Sequence
-from unittest.mock import MagicMock
+import os
+from collections.abc import Callable, Sequence
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from fastmcp import FastMCP
 from fastmcp.server.middleware import MiddlewareContext
 from mcp.types import Tool, ToolAnnotations
 
-from fastmcp_extensions import ToolFilterFn
+from fastmcp_extensions import ALWAYS_TRUE, ToolFilterFn
 from fastmcp_extensions._middleware import ToolFilterMiddleware
 
 
@@ -34,13 +36,13 @@ def _create_mock_tool(
 
 def _create_mock_context(
     method: str,
-    message: MagicMock | None = None,
+    message: Any = None,
 ) -> MiddlewareContext:
-    """Create a mock MiddlewareContext for testing."""
-    context = MagicMock(spec=MiddlewareContext)
-    context.method = method
-    context.message = message or MagicMock()
-    return context
+    """Create a MiddlewareContext for testing."""
+    return MiddlewareContext(
+        message=message if message is not None else SimpleNamespace(),
+        method=method,
+    )
 
 
 @pytest.mark.unit
@@ -111,6 +113,7 @@ async def test_on_list_tools_returns_all_when_filter_allows_all() -> None:
 
     assert len(result) == 2
     assert {t.name for t in result} == {"tool1", "tool2"}
+    assert result is all_tools
 
 
 @pytest.mark.unit
@@ -156,14 +159,13 @@ async def test_on_call_tool_allows_visible_tools() -> None:
     middleware = ToolFilterMiddleware(app, tool_filter=allow_all)
 
     # Create context with tool name
-    message = MagicMock()
-    message.name = "allowed_tool"
+    message = SimpleNamespace(name="allowed_tool")
     context = _create_mock_context("tools/call", message)
 
     # Mock call_next to return a result
-    expected_result = MagicMock()
+    expected_result = object()
 
-    async def mock_call_next(ctx: MiddlewareContext) -> MagicMock:
+    async def mock_call_next(ctx: MiddlewareContext) -> object:
         return expected_result
 
     result = await middleware.on_call_tool(context, mock_call_next)
@@ -188,12 +190,11 @@ async def test_on_call_tool_denies_filtered_tools() -> None:
     middleware = ToolFilterMiddleware(app, tool_filter=deny_all)
 
     # Create context with tool name
-    message = MagicMock()
-    message.name = "filtered_tool"
+    message = SimpleNamespace(name="filtered_tool")
     context = _create_mock_context("tools/call", message)
 
-    async def mock_call_next(ctx: MiddlewareContext) -> MagicMock:
-        return MagicMock()
+    async def mock_call_next(ctx: MiddlewareContext) -> object:
+        return object()
 
     with pytest.raises(ValueError, match="not available"):
         await middleware.on_call_tool(context, mock_call_next)
@@ -214,13 +215,12 @@ async def test_on_call_tool_allows_unknown_tools() -> None:
     middleware = ToolFilterMiddleware(app, tool_filter=deny_all)
 
     # Create context with unknown tool name
-    message = MagicMock()
-    message.name = "unknown_tool"
+    message = SimpleNamespace(name="unknown_tool")
     context = _create_mock_context("tools/call", message)
 
-    expected_result = MagicMock()
+    expected_result = object()
 
-    async def mock_call_next(ctx: MiddlewareContext) -> MagicMock:
+    async def mock_call_next(ctx: MiddlewareContext) -> object:
         return expected_result
 
     # Should allow the call since the tool isn't found (let FastMCP handle the error)
@@ -283,3 +283,420 @@ async def test_on_list_tools_parametrized(
         assert result[0].name == tool_name
     else:
         assert len(result) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_reuses_filter_decisions_within_ttl() -> None:
+    """Test that filter decisions are reused while the upstream list is refetched."""
+    app = FastMCP("test-server")
+    filter_calls = 0
+    upstream_calls = 0
+
+    def counting_filter(tool: Tool, app: FastMCP) -> bool:
+        nonlocal filter_calls
+        filter_calls += 1
+        return True
+
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=counting_filter, list_tools_cache_ttl=60
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        nonlocal upstream_calls
+        upstream_calls += 1
+        return [_create_mock_tool("tool1"), _create_mock_tool("tool2")]
+
+    context = _create_mock_context("tools/list")
+    first = await middleware.on_list_tools(context, mock_call_next)
+    second = await middleware.on_list_tools(context, mock_call_next)
+
+    assert upstream_calls == 2
+    assert filter_calls == 2
+    assert [t.name for t in first] == [t.name for t in second] == ["tool1", "tool2"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_cache_does_not_share_upstream_lists() -> None:
+    """Test that each request sees its own upstream tool list when caching."""
+    app = FastMCP("test-server")
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=allow_all, list_tools_cache_ttl=60
+    )
+    upstream_lists = iter(
+        [[_create_mock_tool("admin_tool")], [_create_mock_tool("user_tool")]]
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return next(upstream_lists)
+
+    context = _create_mock_context("tools/list")
+    first = await middleware.on_list_tools(context, mock_call_next)
+    second = await middleware.on_list_tools(context, mock_call_next)
+
+    assert [t.name for t in first] == ["admin_tool"]
+    assert [t.name for t in second] == ["user_tool"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_does_not_cache_by_default() -> None:
+    """Test that the upstream tool list is fetched on every call by default."""
+    app = FastMCP("test-server")
+    upstream_calls = 0
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    middleware = ToolFilterMiddleware(app, tool_filter=allow_all)
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        nonlocal upstream_calls
+        upstream_calls += 1
+        return [_create_mock_tool("tool1")]
+
+    context = _create_mock_context("tools/list")
+    await middleware.on_list_tools(context, mock_call_next)
+    await middleware.on_list_tools(context, mock_call_next)
+
+    assert upstream_calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_cache_is_keyed_by_config(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached filter results are not shared across config values."""
+    from fastmcp_extensions import mcp_server
+    from fastmcp_extensions.tool_filters import readonly_mode_filter
+
+    app = mcp_server("test-server", include_standard_tool_filters=True)
+    all_tools = [
+        _create_mock_tool("read_tool", read_only=True),
+        _create_mock_tool("write_tool"),
+    ]
+
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=readonly_mode_filter, list_tools_cache_ttl=60
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return all_tools
+
+    context = _create_mock_context("tools/list")
+    monkeypatch.setenv("MCP_READONLY_MODE", "0")
+    unrestricted = await middleware.on_list_tools(context, mock_call_next)
+    monkeypatch.setenv("MCP_READONLY_MODE", "1")
+    restricted = await middleware.on_list_tools(context, mock_call_next)
+
+    assert [t.name for t in unrestricted] == ["read_tool", "write_tool"]
+    assert [t.name for t in restricted] == ["read_tool"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_cache_keys_do_not_hold_config_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached filter decisions are keyed on a digest, not raw secrets."""
+    from fastmcp_extensions import MCPServerConfigArg, mcp_server
+
+    secret = "sk-test-secret"
+    monkeypatch.setenv("TEST_API_KEY", secret)
+    app = mcp_server(
+        "test-server",
+        server_config_args=[
+            MCPServerConfigArg(name="api_key", env_var="TEST_API_KEY", sensitive=True)
+        ],
+    )
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=allow_all, list_tools_cache_ttl=60
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("tool1")]
+
+    await middleware.on_list_tools(_create_mock_context("tools/list"), mock_call_next)
+
+    (cache_key,) = middleware._filter_cache
+    assert secret not in repr(cache_key)
+    assert secret.encode() not in cache_key[1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_filter_decisions_expire_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached filter decisions are recomputed once the TTL has passed."""
+    from fastmcp_extensions import _middleware
+
+    app = FastMCP("test-server")
+    filter_calls = 0
+    now = 1000.0
+
+    def counting_filter(tool: Tool, app: FastMCP) -> bool:
+        nonlocal filter_calls
+        filter_calls += 1
+        return True
+
+    monkeypatch.setattr(_middleware.time, "monotonic", lambda: now)
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=counting_filter, list_tools_cache_ttl=60
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("tool1")]
+
+    context = _create_mock_context("tools/list")
+    await middleware.on_list_tools(context, mock_call_next)
+    now += 59
+    await middleware.on_list_tools(context, mock_call_next)
+    assert filter_calls == 1
+
+    now += 2
+    await middleware.on_list_tools(context, mock_call_next)
+    assert filter_calls == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_evicts_least_recently_used_fingerprint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that only `filter_cache_size` config fingerprints are kept."""
+    from fastmcp_extensions import MCPServerConfigArg, mcp_server
+
+    app = mcp_server(
+        "test-server",
+        server_config_args=[
+            MCPServerConfigArg(name="tenant", env_var="TEST_TENANT", required=False)
+        ],
+    )
+    filter_calls: list[str] = []
+
+    def recording_filter(tool: Tool, app: FastMCP) -> bool:
+        filter_calls.append(os.environ["TEST_TENANT"])
+        return True
+
+    middleware = ToolFilterMiddleware(
+        app,
+        tool_filter=recording_filter,
+        list_tools_cache_ttl=60,
+        filter_cache_size=2,
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("tool1")]
+
+    context = _create_mock_context("tools/list")
+    for tenant in ["a", "b", "a", "c", "a", "b"]:
+        monkeypatch.setenv("TEST_TENANT", tenant)
+        await middleware.on_list_tools(context, mock_call_next)
+
+    # "a" stays cached because it was used again before "c" evicted "b"
+    assert filter_calls == ["a", "b", "c", "b"]
+    assert len(middleware._filter_cache) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_cache_does_not_resolve_config_defaults() -> None:
+    """Test that fingerprinting reads raw inputs and skips callable defaults."""
+    from fastmcp_extensions import MCPServerConfigArg, mcp_server
+
+    default_calls = 0
+
+    def expensive_default() -> str:
+        nonlocal default_calls
+        default_calls += 1
+        return "computed"
+
+    app = mcp_server(
+        "test-server",
+        server_config_args=[
+            MCPServerConfigArg(
+                name="token", env_var="TEST_UNSET_TOKEN", default=expensive_default
+            )
+        ],
+    )
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    middleware = ToolFilterMiddleware(
+        app, tool_filter=allow_all, list_tools_cache_ttl=60
+    )
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("tool1")]
+
+    context = _create_mock_context("tools/list")
+    await middleware.on_list_tools(context, mock_call_next)
+    await middleware.on_list_tools(context, mock_call_next)
+
+    assert default_calls == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_on_list_tools_binds_filter_once_per_request() -> None:
+    """Test that a filter's `__bind_request__` binder is used once per list call."""
+    app = FastMCP("test-server")
+    all_tools = [
+        _create_mock_tool("read_tool", read_only=True),
+        _create_mock_tool("write_tool"),
+        _create_mock_tool("another_read", read_only=True),
+    ]
+    bind_calls = 0
+
+    def readonly_filter(tool: Tool, app: FastMCP) -> bool:
+        raise AssertionError("per-tool filter should not be called")
+
+    def bind_readonly(app: FastMCP) -> Callable[[Tool], bool]:
+        nonlocal bind_calls
+        bind_calls += 1
+        return lambda tool: bool(tool.annotations and tool.annotations.readOnlyHint)
+
+    readonly_filter.__bind_request__ = bind_readonly  # type: ignore[attr-defined]
+    middleware = ToolFilterMiddleware(app, tool_filter=readonly_filter)
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return all_tools
+
+    context = _create_mock_context("tools/list")
+    result = await middleware.on_list_tools(context, mock_call_next)
+
+    assert bind_calls == 1
+    assert [t.name for t in result] == ["read_tool", "another_read"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_tool_by_name_caches_mcp_conversion() -> None:
+    """Test that repeated lookups of the same tool reuse its MCP conversion."""
+    app = FastMCP("test-server")
+
+    @app.tool()
+    def cached_tool() -> str:
+        return "success"
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    middleware = ToolFilterMiddleware(app, tool_filter=allow_all)
+
+    first = await middleware._get_tool_by_name("cached_tool")
+    second = await middleware._get_tool_by_name("cached_tool")
+
+    assert first is not None
+    assert first is second
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_always_true_filter_passes_through() -> None:
+    """Test that the ALWAYS_TRUE sentinel returns the upstream tools untouched."""
+    app = FastMCP("test-server")
+    all_tools = [_create_mock_tool("tool1"), _create_mock_tool("tool2")]
+
+    middleware = ToolFilterMiddleware(app, tool_filter=ALWAYS_TRUE)
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return all_tools
+
+    context = _create_mock_context("tools/list")
+    result = await middleware.on_list_tools(context, mock_call_next)
+
+    assert result is all_tools
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_composed_filter_stops_at_first_hiding_filter() -> None:
+    """Test that composed filters run in order and stop once a tool is hidden."""
+    from fastmcp_extensions._middleware import _compose_filters
+
+    app = FastMCP("test-server")
+    calls: list[tuple[str, str]] = []
+
+    def hide_secret(tool: Tool, app: FastMCP) -> bool:
+        calls.append(("hide_secret", tool.name))
+        return tool.name != "secret"
+
+    def allow_all(tool: Tool, app: FastMCP) -> bool:
+        calls.append(("allow_all", tool.name))
+        return True
+
+    composed = _compose_filters([hide_secret, ALWAYS_TRUE, allow_all])
+    middleware = ToolFilterMiddleware(app, tool_filter=composed)
+
+    assert composed(_create_mock_tool("secret"), app) is False
+    assert calls == [("hide_secret", "secret")]
+
+    calls.clear()
+
+    async def mock_call_next(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("secret"), _create_mock_tool("public")]
+
+    result = await middleware.on_list_tools(
+        _create_mock_context("tools/list"), mock_call_next
+    )
+
+    assert [t.name for t in result] == ["public"]
+    assert calls == [
+        ("hide_secret", "secret"),
+        ("hide_secret", "public"),
+        ("allow_all", "public"),
+    ]
+
+
+@pytest.mark.unit
+def test_compose_filters_collapses_trivial_inputs() -> None:
+    """Test that no filters give ALWAYS_TRUE and one filter is used as-is."""
+    from fastmcp_extensions._middleware import _compose_filters
+
+    def only_filter(tool: Tool, app: FastMCP) -> bool:
+        return True
+
+    assert _compose_filters([]) is ALWAYS_TRUE
+    assert _compose_filters([ALWAYS_TRUE]) is ALWAYS_TRUE
+    assert _compose_filters([ALWAYS_TRUE, only_filter]) is only_filter
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_composed_filter_raises_config_errors_only_for_evaluated_tools(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that invalid filter config fails per tool, not on every list call."""
+    from fastmcp_extensions import mcp_server
+    from fastmcp_extensions.tool_filters import module_filter, readonly_mode_filter
+
+    monkeypatch.setenv("MCP_INCLUDE_MODULES", "a")
+    monkeypatch.setenv("MCP_EXCLUDE_MODULES", "b")
+    app = mcp_server("test-server", include_standard_tool_filters=True)
+    middleware = ToolFilterMiddleware.from_filters(
+        app, [readonly_mode_filter, module_filter]
+    )
+    context = _create_mock_context("tools/list")
+
+    async def no_tools(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return []
+
+    async def one_tool(ctx: MiddlewareContext) -> Sequence[Tool]:
+        return [_create_mock_tool("tool1")]
+
+    assert await middleware.on_list_tools(context, no_tools) == []
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        await middleware.on_list_tools(context, one_tool)
@@ -1,7 +1,9 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 """Unit tests for the mcp_server() helper function."""
 
-import os
+import sys
+from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -11,39 +13,62 @@ from mcp.types import Tool, ToolAnnotations
 from fastmcp_extensions import (
     MCPServerConfig,
     MCPServerConfigArg,
+    ToolFilterFn,
     get_mcp_config,
     mcp_server,
 )
+from fastmcp_extensions import server_config as _server_config
+from fastmcp_extensions._middleware import ToolFilterMiddleware
+from fastmcp_extensions.server import _get_git_sha, _list_sibling_modules
 from fastmcp_extensions.tool_filters import (
     _parse_csv_config,
+    module_filter,
     no_client_filesystem_filter,
+    no_destructive_tools_filter,
+    readonly_mode_filter,
+    tool_exclusion_filter,
+    trusted_execution_filter,
 )
 
+pytestmark = pytest.mark.unit
 
-@pytest.mark.unit
-def test_mcp_server_returns_fastmcp_instance() -> None:
+# Config args are frozen, so tests that only read them can share one instance.
+_API_KEY_HEADER_ARG = MCPServerConfigArg(name="api_key", http_header_key="X-API-Key")
+_WORKSPACE_HEADER_ARG = MCPServerConfigArg(
+    name="workspace", http_header_key="X-Workspace"
+)
+_REGION_ARG = MCPServerConfigArg(name="region", env_var="TEST_REGION", default="us")
+
+
+@pytest.fixture(scope="module")
+def basic_app() -> FastMCP:
+    """A default mcp_server() app, shared by tests that only read from it."""
+    return mcp_server("test-server")
+
+
+@pytest.fixture(scope="module")
+def standard_filters_app() -> FastMCP:
+    """An app with the standard tool filters, shared by tests that only read from it."""
+    return mcp_server("test-server", include_standard_tool_filters=True)
+
+
+def test_mcp_server_returns_fastmcp_instance(basic_app: FastMCP) -> None:
     """Test that mcp_server() returns a FastMCP instance."""
-    app = mcp_server("test-server")
-    assert isinstance(app, FastMCP)
+    assert isinstance(basic_app, FastMCP)
 
 
-@pytest.mark.unit
-def test_mcp_server_has_config_attached() -> None:
+def test_mcp_server_has_config_attached(basic_app: FastMCP) -> None:
     """Test that mcp_server() attaches config to the app."""
-    app = mcp_server("test-server")
-    assert hasattr(app, "x_mcp_server_config")
-    assert isinstance(app.x_mcp_server_config, MCPServerConfig)
+    assert hasattr(basic_app, "x_mcp_server_config")
+    assert isinstance(basic_app.x_mcp_server_config, MCPServerConfig)
 
 
-@pytest.mark.unit
-def test_mcp_server_config_stores_name() -> None:
+def test_mcp_server_config_stores_name(basic_app: FastMCP) -> None:
     """Test that the config stores the server name."""
-    app = mcp_server("my-test-server")
-    config: MCPServerConfig = app.x_mcp_server_config
-    assert config.name == "my-test-server"
+    config: MCPServerConfig = basic_app.x_mcp_server_config
+    assert config.name == "test-server"
 
 
-@pytest.mark.unit
 def test_mcp_server_config_stores_advertised_properties() -> None:
     """Test that the config stores advertised properties."""
     props = {
@@ -55,7 +80,6 @@ def test_mcp_server_config_stores_advertised_properties() -> None:
     assert config.advertised_properties == props
 
 
-@pytest.mark.unit
 def test_mcp_server_config_stores_config_args() -> None:
     """Test that the config stores server config args."""
     config_args = [
@@ -74,163 +98,278 @@ def test_mcp_server_config_stores_config_args() -> None:
 
 
 @pytest.mark.parametrize(
-    "name,http_header_key,env_var,required,sensitive",
+    "kwargs",
     [
         pytest.param(
-            "api_key", "X-API-Key", "API_KEY", True, True, id="required_sensitive"
+            {
+                "name": "api_key",
+                "http_header_key": "X-API-Key",
+                "env_var": "API_KEY",
+                "required": True,
+                "sensitive": True,
+            },
+            id="required_sensitive",
         ),
         pytest.param(
-            "workspace",
-            "X-Workspace",
-            "WORKSPACE_ID",
-            False,
-            False,
+            {
+                "name": "workspace",
+                "http_header_key": "X-Workspace",
+                "env_var": "WORKSPACE_ID",
+                "required": False,
+                "sensitive": False,
+            },
             id="optional_not_sensitive",
         ),
         pytest.param(
-            "token",
-            "Authorization",
-            "AUTH_TOKEN",
-            True,
-            False,
+            {
+                "name": "token",
+                "http_header_key": "Authorization",
+                "env_var": "AUTH_TOKEN",
+                "required": True,
+                "sensitive": False,
+            },
             id="required_not_sensitive",
         ),
     ],
 )
-@pytest.mark.unit
-def test_mcp_server_config_arg_attributes(
-    name: str, http_header_key: str, env_var: str, required: bool, sensitive: bool
-) -> None:
+def test_mcp_server_config_arg_attributes(kwargs: dict[str, Any]) -> None:
     """Test MCPServerConfigArg stores all attributes correctly."""
-    arg = MCPServerConfigArg(
-        name=name,
-        http_header_key=http_header_key,
-        env_var=env_var,
-        required=required,
-        sensitive=sensitive,
-    )
-    assert arg.name == name
-    assert arg.http_header_key == http_header_key
-    assert arg.env_var == env_var
-    assert arg.required == required
-    assert arg.sensitive == sensitive
+    arg = MCPServerConfigArg(**kwargs)
+    for key, value in kwargs.items():
+        assert getattr(arg, key) == value, key
 
 
-@pytest.mark.unit
-def test_get_mcp_config_from_env_var() -> None:
-    """Test resolving config from environment variable."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            http_header_key="X-API-Key",
-            env_var="TEST_API_KEY",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
+def test_mcp_server_config_arg_is_frozen_and_hashable() -> None:
+    """Test that MCPServerConfigArg is immutable and usable as a dict key."""
+    import dataclasses
 
-    with patch.dict(os.environ, {"TEST_API_KEY": "secret-key-123"}):
-        value = get_mcp_config(app, "api_key")
-        assert value == "secret-key-123"
+    arg = MCPServerConfigArg(name="api_key", http_header_key="X-API-Key")
 
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        arg.env_var = "API_KEY"  # type: ignore[misc]
 
-@pytest.mark.unit
-def test_get_mcp_config_from_http_header() -> None:
-    """Test resolving config from HTTP header (takes precedence over env var)."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            http_header_key="X-API-Key",
-            env_var="TEST_API_KEY",
-            required=True,
+    same = MCPServerConfigArg(name="api_key", http_header_key="X-API-Key")
+    assert {arg: "value"}[same] == "value"
+    assert dataclasses.replace(arg, env_var="API_KEY").env_var == "API_KEY"
+
+
+_HEADER_AND_ENV = {"http_header_key": "X-API-Key", "env_var": "TEST_API_KEY"}
+
+
+@pytest.mark.parametrize(
+    "arg_kwargs,env_value,headers,expected",
+    [
+        pytest.param(
+            _HEADER_AND_ENV, "secret-key-123", None, "secret-key-123", id="env_var"
         ),
-    ]
+        pytest.param(
+            _HEADER_AND_ENV,
+            "env-key",
+            {"X-API-Key": "header-key"},
+            "header-key",
+            id="header_precedence",
+        ),
+        pytest.param(
+            _HEADER_AND_ENV,
+            None,
+            {"x-api-key": "lowercase-header-key"},
+            "lowercase-header-key",
+            id="header_case_insensitive",
+        ),
+        pytest.param(_HEADER_AND_ENV, None, None, ValueError, id="required_missing"),
+        pytest.param(
+            {**_HEADER_AND_ENV, "required": False},
+            None,
+            None,
+            "",
+            id="optional_missing",
+        ),
+        pytest.param(
+            {"env_var": "TEST_API_KEY"},
+            "env-only-value",
+            None,
+            "env-only-value",
+            id="only_env_var",
+        ),
+        pytest.param(
+            {"http_header_key": "X-API-Key"},
+            None,
+            {"X-API-Key": "header-only-value"},
+            "header-only-value",
+            id="only_http_header",
+        ),
+        pytest.param(
+            {"env_var": "TEST_API_KEY", "default": "default-value"},
+            "env-value",
+            None,
+            "env-value",
+            id="env_var_over_default",
+        ),
+        pytest.param(
+            {"env_var": "TEST_API_KEY", "default": "default-value"},
+            None,
+            None,
+            "default-value",
+            id="string_default",
+        ),
+        pytest.param(
+            {"env_var": "TEST_API_KEY", "default": lambda: "callable-default"},
+            None,
+            None,
+            "callable-default",
+            id="callable_default",
+        ),
+    ],
+)
+def test_get_mcp_config_resolution(
+    arg_kwargs: dict[str, Any],
+    env_value: str | None,
+    headers: dict[str, str] | None,
+    expected: str | type[Exception],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test resolving config from headers, env vars, defaults, or nothing."""
+    config_args = [MCPServerConfigArg(name="api_key", **arg_kwargs)]
     app = mcp_server("test-server", server_config_args=config_args)
 
-    with patch.dict(os.environ, {"TEST_API_KEY": "env-key"}), patch(
-        "fastmcp_extensions.server_config.get_http_headers",
-        return_value={"X-API-Key": "header-key"},
-    ):
-        value = get_mcp_config(app, "api_key")
-        assert value == "header-key"
+    if env_value is None:
+        monkeypatch.delenv("TEST_API_KEY", raising=False)
+    else:
+        monkeypatch.setenv("TEST_API_KEY", env_value)
+    if headers is not None:
+        monkeypatch.setattr(_server_config, "get_http_headers", lambda: headers)
 
+    if isinstance(expected, str):
+        assert get_mcp_config(app, "api_key") == expected
+    else:
+        with pytest.raises(expected, match="Required config"):
+            get_mcp_config(app, "api_key")
 
-@pytest.mark.unit
-def test_get_mcp_config_header_case_insensitive() -> None:
-    """Test that HTTP header resolution is case-insensitive."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            http_header_key="X-API-Key",
-            env_var="TEST_API_KEY",
-            required=True,
-        ),
-    ]
+
+def test_get_mcp_config_caches_per_request() -> None:
+    """Test that config values are resolved once per request cache scope."""
+    app = mcp_server("test-server", server_config_args=[_API_KEY_HEADER_ARG])
+
+    with patch(
+        "fastmcp_extensions.server_config.get_http_headers",
+        return_value={"x-api-key": "header-key"},
+    ) as mock_headers:
+        with _server_config._scoped_request_config_cache():
+            assert get_mcp_config(app, "api_key") == "header-key"
+            assert get_mcp_config(app, "api_key") == "header-key"
+        assert mock_headers.call_count == 1
+
+        with _server_config._scoped_request_config_cache():
+            assert get_mcp_config(app, "api_key") == "header-key"
+        assert mock_headers.call_count == 2
+
+        # Outside a request scope nothing is cached
+        assert get_mcp_config(app, "api_key") == "header-key"
+        assert get_mcp_config(app, "api_key") == "header-key"
+        assert mock_headers.call_count == 4
+
+
+def test_get_mcp_config_shares_headers_within_request() -> None:
+    """Test that all config args in one request share one header fetch."""
+    config_args = [_API_KEY_HEADER_ARG, _WORKSPACE_HEADER_ARG]
     app = mcp_server("test-server", server_config_args=config_args)
 
     with patch(
         "fastmcp_extensions.server_config.get_http_headers",
-        return_value={"x-api-key": "lowercase-header-key"},
-    ):
-        value = get_mcp_config(app, "api_key")
-        assert value == "lowercase-header-key"
+        return_value={"X-API-Key": "header-key", "X-Workspace": "ws-1"},
+    ) as mock_headers, _server_config._scoped_request_config_cache():
+        assert get_mcp_config(app, "api_key") == "header-key"
+        assert get_mcp_config(app, "workspace") == "ws-1"
+        assert mock_headers.call_count == 1
 
 
-@pytest.mark.unit
-def test_get_mcp_config_unknown_name_raises_key_error() -> None:
-    """Test that resolving unknown config name raises KeyError."""
-    app = mcp_server("test-server")
+@pytest.mark.asyncio
+async def test_mcp_server_caches_config_per_mcp_request() -> None:
+    """Test that mcp_server() scopes the config cache to each MCP request."""
+    from fastmcp import Client
 
-    with pytest.raises(KeyError, match="Unknown config argument"):
-        get_mcp_config(app, "nonexistent")
+    default_calls = 0
 
+    def counting_default() -> str:
+        nonlocal default_calls
+        default_calls += 1
+        return "computed"
+
+    app = mcp_server(
+        "test-server",
+        server_config_args=[
+            MCPServerConfigArg(
+                name="token", env_var="TEST_UNSET_TOKEN", default=counting_default
+            )
+        ],
+    )
+
+    @app.tool()
+    def read_token_twice() -> str:
+        return get_mcp_config(app, "token") + get_mcp_config(app, "token")
+
+    async with Client(app) as client:
+        first = await client.call_tool("read_token_twice", {})
+        second = await client.call_tool("read_token_twice", {})
+
+    assert first.data == second.data == "computedcomputed"
+    assert default_calls == 2
+
+
+def test_get_mcp_config_accepts_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_mcp_config resolves the app from a tool Context."""
+    from fastmcp import Context
 
-@pytest.mark.unit
-def test_get_mcp_config_required_missing_raises_value_error() -> None:
-    """Test that missing required config raises ValueError."""
     config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            http_header_key="X-API-Key",
-            env_var="TEST_NONEXISTENT_VAR_12345",
-            required=True,
-        ),
+        MCPServerConfigArg(name="api_key", env_var="TEST_API_KEY"),
     ]
     app = mcp_server("test-server", server_config_args=config_args)
 
-    mock_headers = patch(
-        "fastmcp_extensions.server_config.get_http_headers", return_value=None
-    )
-    with mock_headers, pytest.raises(ValueError, match="Required config"):
-        get_mcp_config(app, "api_key")
+    monkeypatch.setenv("TEST_API_KEY", "env-key")
 
+    assert get_mcp_config(Context(fastmcp=app), "api_key") == "env-key"
 
-@pytest.mark.unit
-def test_get_mcp_config_optional_missing_returns_empty_string() -> None:
-    """Test that missing optional config returns empty string."""
-    config_args = [
-        MCPServerConfigArg(
-            name="optional_key",
-            http_header_key="X-Optional",
-            env_var="NONEXISTENT_OPTIONAL_VAR",
-            required=False,
-        ),
-    ]
+
+def test_resolve_all_fetches_headers_once() -> None:
+    """Test that resolve_all resolves every arg with a single header fetch."""
+    config_args = [_API_KEY_HEADER_ARG, _WORKSPACE_HEADER_ARG, _REGION_ARG]
     app = mcp_server("test-server", server_config_args=config_args)
+    config: MCPServerConfig = app.x_mcp_server_config
+
+    with patch(
+        "fastmcp_extensions.server_config.get_http_headers",
+        return_value={"X-API-Key": "header-key", "X-Workspace": "ws-1"},
+    ) as mock_headers:
+        assert config.resolve_all() == {
+            "api_key": "header-key",
+            "workspace": "ws-1",
+            "region": "us",
+        }
+        assert mock_headers.call_count == 1
+
+
+def test_resolve_all_skips_headers_without_header_args() -> None:
+    """Test that resolve_all never fetches headers when no arg uses them."""
+    app = mcp_server("test-server", server_config_args=[_REGION_ARG])
+    config: MCPServerConfig = app.x_mcp_server_config
 
-    with patch("fastmcp_extensions.server_config.get_http_headers", return_value=None):
-        value = get_mcp_config(app, "optional_key")
-        assert value == ""
+    with patch("fastmcp_extensions.server_config.get_http_headers") as mock_headers:
+        assert config.resolve_all() == {"region": "us"}
+        mock_headers.assert_not_called()
+
+
+def test_get_mcp_config_unknown_name_raises_key_error(basic_app: FastMCP) -> None:
+    """Test that resolving unknown config name raises KeyError."""
+    with pytest.raises(KeyError, match="Unknown config argument"):
+        get_mcp_config(basic_app, "nonexistent")
 
 
-@pytest.mark.unit
 def test_mcp_server_passes_kwargs_to_fastmcp() -> None:
     """Test that additional kwargs are passed to FastMCP constructor."""
     app = mcp_server("test-server", instructions="Test instructions")
     assert app.instructions == "Test instructions"
 
 
-@pytest.mark.unit
 def test_mcp_server_config_default_values() -> None:
     """Test MCPServerConfigArg default values."""
     arg = MCPServerConfigArg(name="test")
@@ -241,98 +380,6 @@ def test_mcp_server_config_default_values() -> None:
     assert arg.sensitive is False
 
 
-@pytest.mark.unit
-def test_get_mcp_config_with_string_default() -> None:
-    """Test resolving config with a string default value."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            env_var="NONEXISTENT_VAR_12345",
-            default="default-value",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
-
-    with patch("fastmcp_extensions.server_config.get_http_headers", return_value=None):
-        value = get_mcp_config(app, "api_key")
-        assert value == "default-value"
-
-
-@pytest.mark.unit
-def test_get_mcp_config_with_callable_default() -> None:
-    """Test resolving config with a callable default value."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            env_var="NONEXISTENT_VAR_12345",
-            default=lambda: "callable-default",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
-
-    with patch("fastmcp_extensions.server_config.get_http_headers", return_value=None):
-        value = get_mcp_config(app, "api_key")
-        assert value == "callable-default"
-
-
-@pytest.mark.unit
-def test_get_mcp_config_env_var_takes_precedence_over_default() -> None:
-    """Test that env var takes precedence over default value."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            env_var="TEST_API_KEY",
-            default="default-value",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
-
-    with patch.dict(os.environ, {"TEST_API_KEY": "env-value"}):
-        value = get_mcp_config(app, "api_key")
-        assert value == "env-value"
-
-
-@pytest.mark.unit
-def test_get_mcp_config_with_only_env_var() -> None:
-    """Test resolving config with only env_var set (no http_header_key)."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            env_var="TEST_API_KEY",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
-
-    with patch.dict(os.environ, {"TEST_API_KEY": "env-only-value"}):
-        value = get_mcp_config(app, "api_key")
-        assert value == "env-only-value"
-
-
-@pytest.mark.unit
-def test_get_mcp_config_with_only_http_header() -> None:
-    """Test resolving config with only http_header_key set (no env_var)."""
-    config_args = [
-        MCPServerConfigArg(
-            name="api_key",
-            http_header_key="X-API-Key",
-            required=True,
-        ),
-    ]
-    app = mcp_server("test-server", server_config_args=config_args)
-
-    with patch(
-        "fastmcp_extensions.server_config.get_http_headers",
-        return_value={"X-API-Key": "header-only-value"},
-    ):
-        value = get_mcp_config(app, "api_key")
-        assert value == "header-only-value"
-
-
-@pytest.mark.unit
 def test_mcp_server_with_tool_filters() -> None:
     """Test that mcp_server() registers tool filter middleware."""
 
@@ -345,37 +392,43 @@ def test_mcp_server_with_tool_filters() -> None:
     assert len(app.middleware) >= 1
 
 
-@pytest.mark.unit
 def test_mcp_server_with_multiple_tool_filters() -> None:
-    """Test that mcp_server() registers multiple tool filter middleware."""
+    """Test that mcp_server() combines multiple tool filters into one middleware."""
 
     def filter_one(tool: Tool, app: FastMCP) -> bool:
-        return True
+        return tool.name != "hidden_by_one"
 
     def filter_two(tool: Tool, app: FastMCP) -> bool:
-        return True
+        return tool.name != "hidden_by_two"
 
     app = mcp_server("test-server", tool_filters=[filter_one, filter_two])
 
-    # Verify both middleware were registered
-    assert len(app.middleware) >= 2
-
-
-@pytest.mark.unit
-def test_mcp_server_without_tool_filters() -> None:
+    # Verify a single middleware applies both filters
+    filter_middleware = [
+        m for m in app.middleware if isinstance(m, ToolFilterMiddleware)
+    ]
+    assert len(filter_middleware) == 1
+    composed = filter_middleware[0]._tool_filter
+    for name, expected_visible in [
+        ("visible", True),
+        ("hidden_by_one", False),
+        ("hidden_by_two", False),
+    ]:
+        tool = Tool(name=name, inputSchema={"type": "object", "properties": {}})
+        assert composed(tool, app) is expected_visible
+
+
+def test_mcp_server_without_tool_filters(basic_app: FastMCP) -> None:
     """Test that mcp_server() works without tool_filters parameter."""
-    app = mcp_server("test-server")
-
     # Should work without any tool filters
-    assert isinstance(app, FastMCP)
+    assert isinstance(basic_app, FastMCP)
 
 
-@pytest.mark.unit
-def test_mcp_server_include_standard_tool_filters_adds_config_args() -> None:
+def test_mcp_server_include_standard_tool_filters_adds_config_args(
+    standard_filters_app: FastMCP,
+) -> None:
     """Test that include_standard_tool_filters=True adds standard config args."""
-    app = mcp_server("test-server", include_standard_tool_filters=True)
-
-    config = app.x_mcp_server_config
+    config = standard_filters_app.x_mcp_server_config
     config_names = [arg.name for arg in config.config_args]
 
     # Should include both standard config args
@@ -383,16 +436,15 @@ def test_mcp_server_include_standard_tool_filters_adds_config_args() -> None:
     assert "no_destructive_tools" in config_names
 
 
-@pytest.mark.unit
-def test_mcp_server_include_standard_tool_filters_adds_middleware() -> None:
+def test_mcp_server_include_standard_tool_filters_adds_middleware(
+    standard_filters_app: FastMCP,
+) -> None:
     """Test that include_standard_tool_filters=True adds filter middleware."""
-    app = mcp_server("test-server", include_standard_tool_filters=True)
-
-    # Should have at least 2 middleware (one for each standard filter)
-    assert len(app.middleware) >= 2
+    # Should have one ToolFilterMiddleware combining all standard filters
+    middleware = standard_filters_app.middleware
+    assert sum(isinstance(m, ToolFilterMiddleware) for m in middleware) == 1
 
 
-@pytest.mark.unit
 def test_mcp_server_include_standard_tool_filters_false_skips_standard_filters() -> (
     None
 ):
@@ -407,12 +459,9 @@ def test_mcp_server_include_standard_tool_filters_false_skips_standard_filters()
     assert "no_destructive_tools" not in config_names
 
     # Should have no ToolFilterMiddleware (FastMCP v3 may add built-in middleware)
-    from fastmcp_extensions._middleware import ToolFilterMiddleware
-
     assert not any(isinstance(m, ToolFilterMiddleware) for m in app.middleware)
 
 
-@pytest.mark.unit
 def test_mcp_server_include_standard_tool_filters_with_custom_config_args() -> None:
     """Test that include_standard_tool_filters=True works with custom config args."""
     custom_arg = MCPServerConfigArg(
@@ -437,7 +486,6 @@ def test_mcp_server_include_standard_tool_filters_with_custom_config_args() -> N
     assert "no_destructive_tools" in config_names
 
 
-@pytest.mark.unit
 def test_mcp_server_include_standard_tool_filters_with_custom_tool_filters() -> None:
     """Test that include_standard_tool_filters=True works with custom tool filters."""
 
@@ -450,16 +498,15 @@ def test_mcp_server_include_standard_tool_filters_with_custom_tool_filters() ->
         include_standard_tool_filters=True,
     )
 
-    # Should have at least 3 middleware (1 custom + 2 standard)
-    assert len(app.middleware) >= 3
+    # Custom and standard filters share one ToolFilterMiddleware
+    assert sum(isinstance(m, ToolFilterMiddleware) for m in app.middleware) == 1
 
 
-@pytest.mark.unit
-def test_mcp_server_include_standard_tool_filters_includes_module_config_args() -> None:
+def test_mcp_server_include_standard_tool_filters_includes_module_config_args(
+    standard_filters_app: FastMCP,
+) -> None:
     """Test that include_standard_tool_filters=True adds module filtering config args."""
-    app = mcp_server("test-server", include_standard_tool_filters=True)
-
-    config = app.x_mcp_server_config
+    config = standard_filters_app.x_mcp_server_config
     config_names = [arg.name for arg in config.config_args]
 
     # Should include module filtering config args
@@ -468,14 +515,11 @@ def test_mcp_server_include_standard_tool_filters_includes_module_config_args()
     assert "exclude_tools" in config_names
 
 
-@pytest.mark.unit
-def test_mcp_server_include_standard_tool_filters_includes_no_client_filesystem() -> (
-    None
-):
+def test_mcp_server_include_standard_tool_filters_includes_no_client_filesystem(
+    standard_filters_app: FastMCP,
+) -> None:
     """Test that `include_standard_tool_filters=True` adds `no_client_filesystem` config arg."""
-    app = mcp_server("test-server", include_standard_tool_filters=True)
-
-    config = app.x_mcp_server_config
+    config = standard_filters_app.x_mcp_server_config
     config_names = [arg.name for arg in config.config_args]
 
     assert "no_client_filesystem" in config_names
@@ -494,15 +538,14 @@ def test_mcp_server_include_standard_tool_filters_includes_no_client_filesystem(
         pytest.param("false", True, True, id="config_false-annotated-visible"),
     ],
 )
-@pytest.mark.unit
 def test_no_client_filesystem_filter(
     config_value: str,
     has_annotation: bool,
     expected_visible: bool,
+    standard_filters_app: FastMCP,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test `no_client_filesystem_filter` hides annotated tools when config is enabled."""
-    app = mcp_server("test-server", include_standard_tool_filters=True)
-
     annotations_kwargs: dict[str, object] = {}
     if has_annotation:
         annotations_kwargs["requiresClientFilesystem"] = True
@@ -514,46 +557,182 @@ def test_no_client_filesystem_filter(
         annotations=ToolAnnotations(**annotations_kwargs),
     )
 
-    env_patch = {"MCP_NO_CLIENT_FILESYSTEM": config_value} if config_value else {}
-    with patch.dict(os.environ, env_patch, clear=False), patch(
-        "fastmcp_extensions.server_config.get_http_headers",
-        return_value=None,
-    ):
-        result = no_client_filesystem_filter(tool, app)
+    if config_value:
+        monkeypatch.setenv("MCP_NO_CLIENT_FILESYSTEM", config_value)
+
+    result = no_client_filesystem_filter(tool, standard_filters_app)
 
     assert result is expected_visible
 
 
-@pytest.mark.unit
 def test_parse_csv_config_empty_string() -> None:
     """Test `_parse_csv_config` with empty string."""
     result = _parse_csv_config("")
     assert result == []
 
 
-@pytest.mark.unit
 def test_parse_csv_config_single_value() -> None:
     """Test `_parse_csv_config` with single value."""
     result = _parse_csv_config("module1")
     assert result == ["module1"]
 
 
-@pytest.mark.unit
 def test_parse_csv_config_multiple_values() -> None:
     """Test `_parse_csv_config` with multiple values."""
     result = _parse_csv_config("module1,module2,module3")
     assert result == ["module1", "module2", "module3"]
 
 
-@pytest.mark.unit
 def test_parse_csv_config_trims_whitespace() -> None:
     """Test `_parse_csv_config` trims whitespace from values."""
     result = _parse_csv_config("  module1  ,  module2  ,  module3  ")
     assert result == ["module1", "module2", "module3"]
 
 
-@pytest.mark.unit
 def test_parse_csv_config_filters_empty_values() -> None:
     """Test `_parse_csv_config` filters out empty values."""
     result = _parse_csv_config("module1,,module2,  ,module3")
     assert result == ["module1", "module2", "module3"]
+
+
+@pytest.mark.parametrize(
+    "filter_fn",
+    [
+        pytest.param(readonly_mode_filter, id="readonly_mode"),
+        pytest.param(no_destructive_tools_filter, id="no_destructive_tools"),
+        pytest.param(module_filter, id="module"),
+        pytest.param(tool_exclusion_filter, id="tool_exclusion"),
+        pytest.param(no_client_filesystem_filter, id="no_client_filesystem"),
+        pytest.param(trusted_execution_filter, id="trusted_execution"),
+    ],
+)
+def test_standard_filters_bound_predicate_matches_filter(
+    filter_fn: ToolFilterFn,
+    standard_filters_app: FastMCP,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that each standard filter's bound predicate agrees with the filter."""
+    tools = [
+        Tool(
+            name=f"tool_{index}",
+            description="A tool",
+            inputSchema={"type": "object", "properties": {}},
+            annotations=ToolAnnotations(**annotations),
+        )
+        for index, annotations in enumerate(
+            [
+                {"readOnlyHint": True, "mcp_module": "github"},
+                {"destructiveHint": True, "mcp_module": "jira"},
+                {"requiresClientFilesystem": True},
+            ]
+        )
+    ]
+    monkeypatch.setenv("MCP_READONLY_MODE", "1")
+    monkeypatch.setenv("MCP_NO_DESTRUCTIVE_TOOLS", "1")
+    monkeypatch.setenv("MCP_EXCLUDE_MODULES", "jira")
+    monkeypatch.setenv("MCP_EXCLUDE_TOOLS", "tool_0")
+    monkeypatch.setenv("MCP_NO_CLIENT_FILESYSTEM", "1")
+
+    predicate = filter_fn.__bind_request__(standard_filters_app)  # type: ignore[attr-defined]
+    for tool in tools:
+        assert predicate(tool) is filter_fn(tool, standard_filters_app)
+
+
+@pytest.mark.asyncio
+async def test_standard_tool_filters_apply_to_client_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the combined standard filters hide and deny tools end to end."""
+    from fastmcp import Client
+    from fastmcp.exceptions import ToolError
+
+    app = mcp_server("test-server", include_standard_tool_filters=True)
+
+    @app.tool(annotations={"readOnlyHint": True})
+    def read_tool() -> str:
+        return "read"
+
+    @app.tool(annotations={"readOnlyHint": False})
+    def write_tool() -> str:
+        return "write"
+
+    monkeypatch.setenv("MCP_READONLY_MODE", "1")
+
+    async with Client(app) as client:
+        tools = await client.list_tools()
+        assert [tool.name for tool in tools] == ["read_tool"]
+
+        with pytest.raises(ToolError, match="not available"):
+            await client.call_tool("write_tool", {})
+
+
+@pytest.mark.asyncio
+async def test_server_info_resource_payload_is_built_once() -> None:
+    """Test that the server info payload is computed once and reused."""
+    import json
+
+    from fastmcp import Client
+
+    app = mcp_server(
+        "test-server",
+        package_name="nonexistent-package-for-tests",
+        advertised_properties={"docs_url": "https://example.com"},
+    )
+
+    with patch(
+        "fastmcp_extensions.server._get_git_sha", return_value="abc1234"
+    ) as mock_sha:
+        async with Client(app) as client:
+            first = await client.read_resource("test-server://server/info")
+            second = await client.read_resource("test-server://server/info")
+
+    assert mock_sha.call_count == 1
+    assert first[0].text == second[0].text  # type: ignore[union-attr]
+    info = json.loads(first[0].text)  # type: ignore[union-attr]
+    assert info["name"] == "test-server"
+    assert info["git_sha"] == "abc1234"
+    assert info["version"] == "0.0.0+dev"
+    assert info["docs_url"] == "https://example.com"
+
+
+def test_get_git_sha_prefers_env_var(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a GIT_SHA env var is used without shelling out to git."""
+    monkeypatch.setenv("GIT_SHA", "abc1234")
+    _get_git_sha.cache_clear()
+    try:
+        with patch("subprocess.run") as mock_run:
+            assert _get_git_sha() == "abc1234"
+            mock_run.assert_not_called()
+    finally:
+        _get_git_sha.cache_clear()
+
+
+def test_list_sibling_modules_skips_private_modules() -> None:
+    """Test that sibling discovery lists public submodules once per package."""
+    modules = _list_sibling_modules("fastmcp_extensions")
+
+    assert "server" in modules
+    assert "tool_filters" in modules
+    assert not any(name.startswith("_") for name in modules)
+    assert list(modules) == sorted(modules)
+    assert _list_sibling_modules("fastmcp_extensions") is modules
+    assert _list_sibling_modules("os") == ()
+
+
+def test_list_sibling_modules_does_not_cache_import_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a package missing at first discovery is found once importable."""
+    package_dir = tmp_path / "late_sibling_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "tools.py").write_text("")
+
+    with pytest.raises(ImportError):
+        _list_sibling_modules("late_sibling_pkg")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        assert _list_sibling_modules("late_sibling_pkg") == ("tools",)
+    finally:
+        sys.modules.pop("late_sibling_pkg", None)
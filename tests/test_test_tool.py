@@ -0,0 +1,308 @@
+# Copyright (c) 2026 Airbyte, Inc., all rights reserved.
+"""Unit tests for `fastmcp_extensions.utils.test_tool`.
+
+These tests drive small in-process FastMCP apps through the in-memory client
+transport. The HTTP tests serve the app from this process on a localhost port,
+so no separate server process is needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+
+from fastmcp_extensions.utils.test_tool import (
+    MCPTestSession,
+    call_mcp_tools_batch,
+    main,
+    run_batch_tool_test,
+    run_http_tool_test,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def app() -> FastMCP:
+    """Build a small app with two tools."""
+    app = FastMCP("test-tool-app")
+
+    @app.tool()
+    def greet(name: str) -> str:
+        """Greet someone by name."""
+        return f"Hello, {name}!"
+
+    @app.tool()
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_session_calls_several_tools(app: FastMCP) -> None:
+    """Test that one session can list tools and call more than one of them."""
+    async with MCPTestSession(app) as session:
+        tools = await session.list_tools()
+        greeting = await session.call_tool("greet", {"name": "Ada"})
+        total = await session.call_tool("add", {"a": 2, "b": 3})
+
+    assert sorted(tool.name for tool in tools) == ["add", "greet"]
+    assert greeting.data == "Hello, Ada!"  # type: ignore[attr-defined]
+    assert total.data == 5  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_call_mcp_tools_batch_keeps_order_and_captures_errors(
+    app: FastMCP,
+) -> None:
+    """Test that batch results follow input order and failures stay per call."""
+    results = await call_mcp_tools_batch(
+        app,
+        [
+            ("greet", {"name": "Ada"}),
+            ("missing_tool", {}),
+            ("add", {"a": 2, "b": 3}),
+        ],
+        max_concurrent=1,
+    )
+
+    assert [result["tool"] for result in results] == ["greet", "missing_tool", "add"]
+    assert results[0] == {"tool": "greet", "result": "Hello, Ada!"}
+    assert "error" in results[1]
+    assert results[2] == {"tool": "add", "result": 5}
+
+
+def test_run_batch_tool_test_prints_result_data(
+    app: FastMCP,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a JSONL batch prints each tool's data as a JSON list."""
+    batch_file = tmp_path / "calls.jsonl"
+    batch_file.write_text(
+        '{"tool": "greet", "args": {"name": "Ada"}}\n'
+        "\n"
+        '{"tool": "add", "args": {"a": 2, "b": 3}}\n',
+        encoding="utf-8",
+    )
+
+    exit_code = run_batch_tool_test(app, str(batch_file))
+
+    assert exit_code == 0
+    assert json.loads(capsys.readouterr().out) == [
+        {"tool": "greet", "result": "Hello, Ada!"},
+        {"tool": "add", "result": 5},
+    ]
+
+
+def test_run_batch_tool_test_fails_when_a_call_errors(
+    app: FastMCP,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that the batch exit code is 1 if any call fails."""
+    batch_file = tmp_path / "calls.jsonl"
+    batch_file.write_text('{"tool": "missing_tool"}\n', encoding="utf-8")
+
+    assert run_batch_tool_test(app, str(batch_file)) == 1
+    assert "error" in json.loads(capsys.readouterr().out)[0]
+
+
+@pytest.mark.parametrize(
+    "batch_line, message",
+    [
+        pytest.param("{not json", "calls.jsonl:2: invalid JSON", id="malformed"),
+        pytest.param(
+            '{"args": {}}',
+            'calls.jsonl:2: expected an object with a "tool"',
+            id="no-tool",
+        ),
+        pytest.param(
+            '["greet"]',
+            'calls.jsonl:2: expected an object with a "tool"',
+            id="not-object",
+        ),
+        pytest.param(
+            '{"tool": "greet", "args": [1]}',
+            'calls.jsonl:2: "args" must be an object',
+            id="bad-args",
+        ),
+        pytest.param(
+            '{"tool": "greet", "args": []}',
+            'calls.jsonl:2: "args" must be an object',
+            id="empty-list-args",
+        ),
+        pytest.param(
+            '{"tool": "greet", "args": 0}',
+            'calls.jsonl:2: "args" must be an object',
+            id="zero-args",
+        ),
+        pytest.param(
+            '{"tool": "greet", "args": ""}',
+            'calls.jsonl:2: "args" must be an object',
+            id="empty-string-args",
+        ),
+        pytest.param(
+            '{"tool": "greet", "args": null}',
+            'calls.jsonl:2: "args" must be an object',
+            id="null-args",
+        ),
+    ],
+)
+def test_main_reports_invalid_batch_lines(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    batch_line: str,
+    message: str,
+) -> None:
+    """Test that an invalid batch line is a usage error naming the line."""
+    batch_file = tmp_path / "calls.jsonl"
+    batch_file.write_text(f'{{"tool": "greet"}}\n{batch_line}\n', encoding="utf-8")
+    monkeypatch.setattr(
+        sys, "argv", ["test_tool", "--app", "unused:app", "--batch", str(batch_file)]
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("max_concurrent", ["0", "-1"])
+def test_main_rejects_max_concurrent_below_one(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    max_concurrent: str,
+) -> None:
+    """Test that --max-concurrent below 1 is a usage error instead of a hang."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "test_tool",
+            "--app",
+            "unused:app",
+            "--batch",
+            "calls.jsonl",
+            "--max-concurrent",
+            max_concurrent,
+        ],
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "--max-concurrent must be at least 1" in capsys.readouterr().err
+
+
+def test_main_reports_unreadable_batch_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a missing batch file is a usage error, not a traceback."""
+    missing = tmp_path / "missing.jsonl"
+    monkeypatch.setattr(
+        sys, "argv", ["test_tool", "--app", "unused:app", "--batch", str(missing)]
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert "cannot read --batch file" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent", [0, -1])
+async def test_call_mcp_tools_batch_rejects_max_concurrent_below_one(
+    app: FastMCP, max_concurrent: int
+) -> None:
+    """Test that an unusable concurrency limit fails before any call is made."""
+    with pytest.raises(ValueError, match="max_concurrent must be at least 1"):
+        await call_mcp_tools_batch(
+            app, [("greet", {"name": "Ada"})], max_concurrent=max_concurrent
+        )
+
+
+def test_run_batch_tool_test_rejects_max_concurrent_below_one(
+    app: FastMCP, tmp_path: Path
+) -> None:
+    """Test that run_batch_tool_test checks max_concurrent up front."""
+    batch_file = tmp_path / "calls.jsonl"
+    batch_file.write_text('{"tool": "greet"}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="max_concurrent must be at least 1"):
+        run_batch_tool_test(app, str(batch_file), max_concurrent=0)
+
+
+def _started_port(stderr: str) -> int:
+    """Return the port announced by `run_http_tool_test()` on stderr."""
+    match = re.search(r"Starting HTTP server on port (\d+)", stderr)
+    assert match is not None, stderr
+    return int(match.group(1))
+
+
+def _assert_port_released(port: int) -> None:
+    """Assert nothing listens on the port any more."""
+    with socket.socket() as probe:
+        assert probe.connect_ex(("127.0.0.1", port)) != 0
+    with socket.socket() as sock:
+        # SO_REUSEADDR tolerates TIME_WAIT connections but not a live listener
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+
+
+@pytest.mark.asyncio
+async def test_run_http_tool_test_round_trip_releases_port(
+    app: FastMCP,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test one tool call over HTTP on a free port, then that the port is freed."""
+    monkeypatch.setenv("MCP_HTTP_PORT", "")
+
+    exit_code = await run_http_tool_test(app, tool_name="greet", args={"name": "Ada"})
+
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert "HTTP transport OK - 2 tools available" in captured.out
+    assert "Hello, Ada!" in captured.out
+    port = _started_port(captured.err)
+    assert port > 0
+    _assert_port_released(port)
+
+
+@pytest.mark.asyncio
+async def test_run_http_tool_test_shuts_down_server_on_tool_error(
+    app: FastMCP,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test that a failing tool call still stops the server and frees the port."""
+    monkeypatch.setenv("MCP_HTTP_PORT", "")
+    with pytest.raises(ToolError):
+        await run_http_tool_test(app, tool_name="missing_tool", args={})
+
+    _assert_port_released(_started_port(capsys.readouterr().err))
+    # The uvicorn server task must have finished, not been left running
+    server_tasks = [
+        task
+        for task in asyncio.all_tasks()
+        if getattr(task.get_coro(), "__qualname__", "")
+        == "run_http_tool_test.<locals>.serve"
+    ]
+    assert server_tasks == []